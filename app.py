@@ -4,7 +4,7 @@ import logging
 import re
 import time
 from typing import Dict, List, Any, Optional, Tuple, Union
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import redis
 import uuid
 from functools import wraps
@@ -16,7 +16,6 @@ from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 from openai import OpenAI
 from openai.types.chat import ChatCompletion
-import pytz
 from dotenv import load_dotenv
 from fx_trader import fx_trader
 from financial_news import FinancialNewsAnalyzer
@@ -303,6 +302,9 @@ if os.getenv('RENDER'):  # Only on Render
 else:
     logger.info("Local deployment - no delayed initialization needed")
 
+# Keep FX rates warm so WhatsApp handlers don't wait on the rate providers
+fx_trader.start()
+
 # Environment validation
 required_env_vars = [
     'TWILIO_ACCOUNT_SID', 
@@ -341,6 +343,8 @@ except Exception as e:
 # Initialize Financial News Analyzer
 try:
     financial_analyzer = FinancialNewsAnalyzer()
+    # One cache warmer per process; the Telegram webhook bot reuses this analyzer
+    financial_analyzer.start()
     logger.info("Financial News Analyzer initialized successfully")
 except Exception as e:
     logger.warning(f"Failed to initialize Financial News Analyzer: {e}")
@@ -412,8 +416,8 @@ class AdvancedMemoryManager:
                 'id': memory_id,
                 'type': memory_type,
                 'content': json.dumps(content),
-                'created_at': datetime.now(pytz.utc).isoformat(),
-                'updated_at': datetime.now(pytz.utc).isoformat()
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'updated_at': datetime.now(timezone.utc).isoformat()
             }
             
             # Save to Redis list of memories
@@ -493,7 +497,7 @@ class AdvancedMemoryManager:
                         # Apply time filter if specified
                         if days_back:
                             created_date = datetime.fromisoformat(memory['created_at'])
-                            cutoff_date = datetime.now(pytz.utc) - timedelta(days=days_back)
+                            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
                             if created_date < cutoff_date:
                                 continue
                         
@@ -518,7 +522,7 @@ class AdvancedMemoryManager:
                     # Apply time filter if specified
                     if days_back:
                         created_date = datetime.fromisoformat(memory['created_at'])
-                        cutoff_date = datetime.now(pytz.utc) - timedelta(days=days_back)
+                        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
                         if created_date < cutoff_date:
                             continue
                     
@@ -566,7 +570,7 @@ class AdvancedMemoryManager:
                 if memory['id'] == memory_id:
                     # Update content and timestamp
                     memory['content'] = json.dumps(updated_content)
-                    memory['updated_at'] = datetime.now(pytz.utc).isoformat()
+                    memory['updated_at'] = datetime.now(timezone.utc).isoformat()
                     
                     # Replace the memory in the list
                     redis_client.lset(redis_key, i, json.dumps(memory))
@@ -704,7 +708,7 @@ class ActionHandler:
                 'action_name': action_name,
                 'params': params,
                 'status': 'pending',
-                'created_at': datetime.now(pytz.utc).isoformat()
+                'created_at': datetime.now(timezone.utc).isoformat()
             }
             
             # Log action start
@@ -722,7 +726,7 @@ class ActionHandler:
             if not validation['valid']:
                 action_tracking['status'] = 'failed'
                 action_tracking['error'] = validation['error']
-                action_tracking['completed_at'] = datetime.now(pytz.utc).isoformat()
+                action_tracking['completed_at'] = datetime.now(timezone.utc).isoformat()
                 redis_client.set(
                     f"action:{action_id}", 
                     json.dumps(action_tracking),
@@ -741,7 +745,7 @@ class ActionHandler:
                     'time': params.get('time', '09:00'),  # Default to 9 AM if time not specified
                     'priority': params.get('priority', 'normal'),
                     'status': 'pending',
-                    'created_at': datetime.now(pytz.utc).isoformat()
+                    'created_at': datetime.now(timezone.utc).isoformat()
                 }
                 
                 try:
@@ -784,7 +788,7 @@ class ActionHandler:
                         'recipient': recipient,
                         'message': message_body,
                         'sid': message.sid,
-                        'sent_at': datetime.now(pytz.utc).isoformat()
+                        'sent_at': datetime.now(timezone.utc).isoformat()
                     }
                     
                     AdvancedMemoryManager.save_long_term_memory(
@@ -816,7 +820,7 @@ class ActionHandler:
                     'description': params.get('description', ''),
                     'location': params.get('location', ''),
                     'status': 'scheduled',
-                    'created_at': datetime.now(pytz.utc).isoformat()
+                    'created_at': datetime.now(timezone.utc).isoformat()
                 }
                 
                 try:
@@ -841,7 +845,7 @@ class ActionHandler:
                     'name': params['preference_name'].strip().lower(),
                     'value': params['preference_value'],
                     'category': params.get('category', 'general'),
-                    'updated_at': datetime.now(pytz.utc).isoformat()
+                    'updated_at': datetime.now(timezone.utc).isoformat()
                 }
                 
                 try:
@@ -893,7 +897,7 @@ class ActionHandler:
                     'category': params.get('category', 'personal'),
                     'status': 'active',
                     'progress': 0,
-                    'created_at': datetime.now(pytz.utc).isoformat()
+                    'created_at': datetime.now(timezone.utc).isoformat()
                 }
                 
                 try:
@@ -921,7 +925,7 @@ class ActionHandler:
             # Update action tracking with successful completion
             action_tracking['status'] = 'completed'
             action_tracking['result'] = result
-            action_tracking['completed_at'] = datetime.now(pytz.utc).isoformat()
+            action_tracking['completed_at'] = datetime.now(timezone.utc).isoformat()
             redis_client.set(
                 f"action:{action_id}", 
                 json.dumps(action_tracking),
@@ -939,7 +943,7 @@ class ActionHandler:
             if 'action_tracking' in locals() and 'action_id' in locals():
                 action_tracking['status'] = 'failed'
                 action_tracking['error'] = str(e)
-                action_tracking['completed_at'] = datetime.now(pytz.utc).isoformat()
+                action_tracking['completed_at'] = datetime.now(timezone.utc).isoformat()
                 redis_client.set(
                     f"action:{action_id}", 
                     json.dumps(action_tracking),
@@ -963,7 +967,7 @@ class ActionHandler:
             if 'action_tracking' in locals() and 'action_id' in locals():
                 action_tracking['status'] = 'failed'
                 action_tracking['error'] = f"Unexpected error: {str(e)}"
-                action_tracking['completed_at'] = datetime.now(pytz.utc).isoformat()
+                action_tracking['completed_at'] = datetime.now(timezone.utc).isoformat()
                 redis_client.set(
                     f"action:{action_id}", 
                     json.dumps(action_tracking),
@@ -1936,7 +1940,7 @@ def health_check() -> Dict:
         status = {
             "service": "evocash-fx-trading-bot",
             "status": "ok",
-            "timestamp": datetime.now(pytz.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "version": "3.0.0",
             "features": [
                 "fx-trading",
@@ -1962,7 +1966,7 @@ def health_check() -> Dict:
             "service": "evocash-fx-trading-bot",
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now(pytz.utc).isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
         return jsonify(status), 500
@@ -1980,10 +1984,15 @@ def get_financial_news():
             }), 503
         
         news_data = financial_analyzer.get_latest_financial_news()
+        # Drop internal fields (e.g. the lowercased '_lc' search text) from the API payload
+        news_data = {
+            **news_data,
+            'news': [{k: v for k, v in item.items() if not k.startswith('_')} for item in news_data.get('news', [])]
+        }
         return jsonify({
             'status': 'success',
             'data': news_data,
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         })
     except Exception as e:
         logger.error(f"Financial news API error: {e}")
@@ -2007,7 +2016,7 @@ def get_market_analysis():
         return jsonify({
             'status': 'success',
             'data': market_data,
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         })
     except Exception as e:
         logger.error(f"Market analysis API error: {e}")
@@ -2031,7 +2040,7 @@ def get_trading_insights():
         return jsonify({
             'status': 'success',
             'data': insights,
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         })
     except Exception as e:
         logger.error(f"Trading insights API error: {e}")
@@ -2055,7 +2064,7 @@ def get_gold_analysis():
         return jsonify({
             'status': 'success',
             'data': gold_data,
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         })
     except Exception as e:
         logger.error(f"Gold analysis API error: {e}")
@@ -2082,7 +2091,7 @@ def chat_page():
 @limiter.exempt
 def ping():
     """Simple ping endpoint for basic keep-alive"""
-    return {"status": "alive", "timestamp": datetime.now(pytz.utc).isoformat()}
+    return {"status": "alive", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 @app.route('/keep-alive', methods=['GET', 'POST'])
 @limiter.exempt
@@ -2111,7 +2120,7 @@ def telegram_webhook():
             return jsonify({"status": "error", "message": "Bot not configured"}), 500
         
         # Process the webhook update
-        bot = TelegramBot(bot_token)
+        bot = TelegramBot(bot_token, financial_analyzer=financial_analyzer)
         
         # Run the async handler
         loop = None
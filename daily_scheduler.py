@@ -7,7 +7,7 @@ import schedule
 import time
 import threading
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import logging
 from fx_trader import fx_trader
 from twilio.rest import Client
@@ -19,7 +19,7 @@ class DailyRateScheduler:
     def __init__(self, twilio_client, whatsapp_numbers=None):
         self.twilio_client = twilio_client
         self.whatsapp_numbers = whatsapp_numbers or []
-        self.gulf_tz = pytz.timezone('Asia/Dubai')  # Gulf time (UAE)
+        self.gulf_tz = ZoneInfo('Asia/Dubai')  # Gulf time (UAE)
         self.from_number = os.getenv('TWILIO_WHATSAPP_NUMBER')
         
     def add_subscriber(self, phone_number):
@@ -8,7 +8,7 @@ import time
 import threading
 import requests
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import logging
 from fx_trader import fx_trader
 from twilio.rest import Client
@@ -20,7 +20,7 @@ class AdvancedScheduler:
     def __init__(self, twilio_client, whatsapp_numbers=None, server_url=None):
         self.twilio_client = twilio_client
         self.whatsapp_numbers = whatsapp_numbers or []
-        self.gulf_tz = pytz.timezone('Asia/Dubai')  # Gulf time (UAE)
+        self.gulf_tz = ZoneInfo('Asia/Dubai')  # Gulf time (UAE)
         self.from_number = os.getenv('TWILIO_WHATSAPP_NUMBER')
         
         # Auto-detect server URL for different environments
@@ -3,7 +3,6 @@ Financial News and Market Analysis Module
 Integrates with Finviz and other free APIs to provide real-time market insights
 """
 
-import yfinance as yf
 import requests
 import xml.etree.ElementTree as ET
 import json
@@ -12,7 +11,6 @@ import logging
 from typing import Dict, List, Optional, Tuple
 import re
 import os
-import pandas as pd
 
 try:
     from finvizfinance.quote import finvizfinance
@@ -74,21 +72,272 @@ class FinancialNewsAnalyzer:
         self.market_cache = {}
         self.cache_timeout = 300  # 5 minutes
 
-import yfinance as yf
 import requests
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timedelta
 import logging
 from typing import Dict, List, Optional, Tuple
 import re
+import asyncio
+import bisect
+from collections import Counter, namedtuple
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import math
 from bs4 import BeautifulSoup
 import os
+import threading
+import time
+from types import MappingProxyType
+from cachetools import TTLCache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# libxml2-backed RSS parsing when available; same find/findall API as the stdlib
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+# Market sentiment keywords used to score news in get_enhanced_market_analysis
+BULLISH_KEYWORDS = ('rally', 'surge', 'climb', 'advance', 'gain', 'rise', 'jump', 'soar')
+BEARISH_KEYWORDS = ('fall', 'drop', 'decline', 'plunge', 'tumble', 'sink', 'crash', 'sell-off')
+
+# Single-pass sentiment scan: one regex over the news text instead of one count() per keyword
+_SENTIMENT_RE = re.compile(r'\b(' + '|'.join(map(re.escape, BULLISH_KEYWORDS + BEARISH_KEYWORDS)) + r')')
+_SENTIMENT_WEIGHT = {**{word: 1 for word in BULLISH_KEYWORDS}, **{word: -1 for word in BEARISH_KEYWORDS}}
+# Upper bound on keyword hits left in n characters is n // _MIN_SENTIMENT_WORD_LEN
+_MIN_SENTIMENT_WORD_LEN = min(map(len, BULLISH_KEYWORDS + BEARISH_KEYWORDS))
+
+# Headline keywords that flag Fed / China / oil news in get_enhanced_trading_insights
+_NEWS_IMPACT_RE = re.compile(r'\b(fed|powell|china|oil|crude)')
+_NEWS_IMPACT_TOPICS = {'fed': 'fed', 'powell': 'fed', 'china': 'china', 'oil': 'oil', 'crude': 'oil'}
+
+# Headline keywords that pick the trading implication for key market drivers in get_trading_insights
+_MARKET_DRIVER_TOPICS = {
+    'fed': 'rates', 'rate': 'rates', 'inflation': 'rates',
+    'china': 'china', 'trade': 'china', 'tariff': 'china',
+    'oil': 'oil', 'energy': 'oil', 'crude': 'oil'
+}
+_MARKET_DRIVER_RE = re.compile(r'\b(' + '|'.join(_MARKET_DRIVER_TOPICS) + r')')
+
+# Splits a lowercased user query into words for keyword routing
+_QUERY_TOKEN_RE = re.compile(r'[a-z]+')
+
+# HTML tags stripped from feed summaries
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def _keyword_regex(keywords):
+    """Compile keywords into one substring alternation (longest first), like any(k in text for k in keywords)"""
+    return re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+
+def _keyword_scanner(keywords):
+    """
+    Build a function returning the set of keywords that occur in a text,
+    same as {k for k in keywords if k in text} but with a single regex pass
+    """
+    # The lookahead reports a match at every position, not just non-overlapping ones
+    pattern = re.compile('(?=(' + _keyword_regex(keywords).pattern + '))')
+    # Only the longest keyword starting at a position is reported, so a hit implies the keywords inside it
+    implied = {keyword: frozenset(other for other in keywords if other in keyword) for keyword in keywords}
+    
+    def scan(text):
+        found = set()
+        for keyword in set(pattern.findall(text)):
+            found |= implied[keyword]
+        return found
+    return scan
+
+def _keyword_tags(categories):
+    """Map each keyword to the names of the (name, keywords) categories that contain it"""
+    return {
+        keyword: tuple(name for name, members in categories if keyword in members)
+        for _, keywords in categories for keyword in keywords
+    }
+
+# News impact classification keywords used by analyze_news_impact (substring matches)
+HIGH_IMPACT_KEYWORDS = (
+    'federal reserve', 'fed', 'interest rate', 'inflation', 'gdp',
+    'unemployment', 'central bank', 'monetary policy', 'recession',
+    'economic growth', 'trade war', 'geopolitical', 'crisis'
+)
+MEDIUM_IMPACT_KEYWORDS = (
+    'earnings', 'economic data', 'manufacturing', 'consumer confidence',
+    'retail sales', 'housing', 'crude oil', 'gold price', 'dollar'
+)
+FX_KEYWORDS = (
+    'currency', 'forex', 'fx', 'dollar', 'euro', 'pound', 'yen',
+    'exchange rate', 'central bank', 'monetary policy'
+)
+GOLD_KEYWORDS = (
+    'gold', 'precious metals', 'inflation', 'safe haven',
+    'economic uncertainty', 'geopolitical tension'
+)
+POSITIVE_WORDS = ('up', 'rise', 'gain', 'growth', 'positive', 'strong', 'boost')
+NEGATIVE_WORDS = ('down', 'fall', 'decline', 'weak', 'negative', 'drop', 'crisis')
+
+
+# All impact keyword lists merged into one scanner; each keyword carries the categories it belongs to
+_IMPACT_CATEGORIES = (
+    ('high', HIGH_IMPACT_KEYWORDS),
+    ('medium', MEDIUM_IMPACT_KEYWORDS),
+    ('fx', FX_KEYWORDS),
+    ('gold', GOLD_KEYWORDS),
+    ('positive', POSITIVE_WORDS),
+    ('negative', NEGATIVE_WORDS)
+)
+_IMPACT_KEYWORD_TAGS = _keyword_tags(_IMPACT_CATEGORIES)
+_IMPACT_SCAN = _keyword_scanner(tuple(_IMPACT_KEYWORD_TAGS))
+
+# Relevance keywords used by _filter_fx_relevant_news; the score is how many distinct ones appear
+FX_RELEVANCE_KEYWORDS = (
+    'currency', 'forex', 'fx', 'dollar', 'euro', 'pound', 'yen',
+    'federal reserve', 'fed', 'ecb', 'boe', 'boj', 'central bank',
+    'interest rate', 'inflation', 'gdp', 'economic', 'trade',
+    'monetary policy', 'employment', 'consumer price'
+)
+_FX_RELEVANCE_SCAN = _keyword_scanner(FX_RELEVANCE_KEYWORDS)
+
+# Headline sentiment words and themes used by _analyze_news_sentiment (substring matches)
+HEADLINE_BULLISH_WORDS = ('rise', 'gain', 'surge', 'rally', 'boost', 'up', 'strong', 'growth', 'positive')
+HEADLINE_BEARISH_WORDS = ('fall', 'drop', 'decline', 'crash', 'weak', 'down', 'loss', 'negative', 'concern')
+NEWS_THEME_KEYWORDS = (
+    ('Federal Reserve Policy', ('fed', 'federal', 'interest')),
+    ('Inflation', ('inflation',)),
+    ('Employment', ('employment', 'jobs')),
+    ('Corporate Earnings', ('earnings',)),
+    ('Trade Relations', ('trade', 'tariff'))
+)
+_HEADLINE_KEYWORD_TAGS = _keyword_tags(
+    (('bullish', HEADLINE_BULLISH_WORDS), ('bearish', HEADLINE_BEARISH_WORDS)) + NEWS_THEME_KEYWORDS
+)
+_HEADLINE_SCAN = _keyword_scanner(tuple(_HEADLINE_KEYWORD_TAGS))
+
+class MarketPoint(namedtuple('MarketPoint', ('price', 'change_pct'))):
+    """Price and percent change of one quote, read out of its market data dict once"""
+    __slots__ = ()
+    
+    @classmethod
+    def from_quote(cls, quote: Dict) -> 'MarketPoint':
+        return cls(quote.get('price', 'N/A'), quote.get('change_percent', 0))
+
+# Static report text reused on every render
+_NEWS_HEADER = "📰 **LATEST FINANCIAL NEWS**\n\n"
+_NEWS_FOOTER = "💡 *Want more? Ask for 'market analysis' or 'trading insights'*"
+_ANALYSIS_HEADER = "📊 **COMPREHENSIVE MARKET ANALYSIS**\n\n"
+_FX_HEADER = "💱 **MAJOR FX PAIRS:**\n"
+_COMM_HEADER = "\n🥇 **COMMODITIES & SAFE HAVENS:**\n"
+_SENTIMENT_HEADER = "\n🎯 **MARKET SENTIMENT:**\n"
+_ANALYSIS_FOOTER = "\n💡 *Ask for 'gold prices' for detailed precious metals analysis*"
+_INSIGHTS_HEADER = "🎯 **ENHANCED TRADING INSIGHTS**\n\n"
+_INSIGHTS_FOOTER = "\n💡 *For detailed gold analysis with karat prices, ask for 'gold prices'*"
+
+# get_trading_insights layout; each {..._block} is empty or a run of "\n"-prefixed lines
+_TRADING_INSIGHTS_TEMPLATE = (
+    "📊 **Current Market Analysis & Trading Insights**\n"
+    "{dxy_block}{gold_block}"
+    "\n\n🔄 **Major FX Pairs Analysis:**"
+    "{fx_block}{opportunities_block}"
+    "\n\n{sentiment_emoji} **Market Sentiment**: {sentiment}"
+    "\n   📊 {sentiment_note}"
+    "{drivers_block}"
+    "\n\n💡 **Session-Specific Strategy:**"
+    "{session_block}"
+    "\n\n⚖️ **Risk Management:**"
+    "{risk_block}"
+    "\n• **Economic calendar**: Check for upcoming releases (NFP, CPI, Fed minutes)"
+    "\n• **Central bank watch**: Monitor Fed, ECB, BOJ communications"
+    "\n\n⚠️ **Disclaimer**: AI-enhanced analysis based on real market data and news. "
+    "Not financial advice. Always verify information and consult professionals before trading."
+)
+_SESSION_ADVICE = {
+    'overlap': (
+        "\n• **Prime time**: London/NY overlap - highest liquidity for major pairs"
+        "\n• **Focus**: EUR/USD, GBP/USD, USD/JPY for best execution"
+        "\n• **Strategy**: Breakout trades and news-based momentum"
+    ),
+    'asian': (
+        "\n• **Asian session**: Lower volatility, range-bound trading"
+        "\n• **Focus**: AUD/USD, USD/JPY, NZD/USD most active"
+        "\n• **Strategy**: Range trading, carry trades"
+    ),
+    'london': (
+        "\n• **London session**: European focus, moderate volatility"
+        "\n• **Focus**: EUR/USD, GBP/USD, EUR/GBP"
+        "\n• **Strategy**: Trend following, economic data trades"
+    ),
+    'off_hours': (
+        "\n• **Off-hours trading**: Lower liquidity, wider spreads"
+        "\n• **Caution**: Avoid large positions, watch for gaps"
+    )
+}
+_RISK_ADVICE = {
+    'high': (
+        "\n• **High volatility expected**: Reduce position sizes by 30-50%"
+        "\n• **Tight stops**: Use closer stop losses due to news-driven moves"
+    ),
+    'moderate': (
+        "\n• **Moderate volatility**: Standard position sizing appropriate"
+        "\n• **Watch key levels**: Respect major support/resistance"
+    ),
+    'low': (
+        "\n• **Low volatility**: Can use wider stops, consider range strategies"
+        "\n• **Patience required**: Wait for clear setups in quiet markets"
+    )
+}
+_DRIVER_IMPLICATIONS = {
+    'rates': "\n  💱 Likely to impact USD pairs and bonds",
+    'china': "\n  💱 May affect CNY, AUD, commodity currencies",
+    'oil': "\n  💱 Watch CAD, NOK, and energy-related pairs"
+}
+
 class FinancialNewsAnalyzer:
-    def __init__(self):
+    # Symbols shown by get_enhanced_market_analysis, in display order
+    _FX_PAIRS = ('EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD')
+    _COMMODITIES = ('Gold', 'Silver', 'Oil_WTI')
+    _FX_SET = frozenset(_FX_PAIRS)
+    _COMM_SET = frozenset(_COMMODITIES)
+
+    # FX trend lookup: bisect_right over the thresholds gives
+    # < -0.25 Weak, < 0 Soft, == 0 Flat, <= 0.25 Mild, > 0.25 Strong
+    _FX_THRESHOLDS = (-0.25, 0.0, math.nextafter(0.0, 1.0), math.nextafter(0.25, 1.0))
+    _FX_LABELS = (("🔴", "Weak"), ("🟠", "Soft"), ("⚪", "Flat"), ("🔵", "Mild"), ("🟢", "Strong"))
+
+    # Growth currencies averaged for the risk-on/risk-off read
+    _RISK_ON_PAIRS = frozenset({'EUR/USD', 'GBP/USD', 'AUD/USD'})
+    # USD-quoted pairs summed (in this order) for the USD strength read in _generate_trading_insights
+    _USD_STRENGTH_PAIRS = ('EUR/USD', 'GBP/USD', 'AUD/USD')
+
+    # Whole-word query routing for get_enhanced_trading_insights
+    _GOLD_QUERY_WORDS = frozenset({'gold', 'precious', 'metal', 'metals'})
+    _USD_QUERY_WORDS = frozenset({'usd', 'dollar', 'dollars', 'dxy'})
+    
+    # Whole-word query routing for _get_query_specific_insights
+    _CURRENCY_QUERY_WORDS = frozenset({'usd', 'dollar', 'dollars', 'eur', 'euro', 'euros', 'gbp', 'pound', 'pounds'})
+    _OIL_QUERY_WORDS = frozenset({'oil', 'crude'})
+    _TREND_QUERY_WORDS = frozenset({'trend', 'trends', 'direction', 'forecast', 'forecasts'})
+
+    # CoinGecko coin ids for the free crypto fallback
+    _COINGECKO_IDS = {'Bitcoin': 'bitcoin', 'Ethereum': 'ethereum'}
+
+    # Commodity display unit and emoji
+    _COMMODITY_META = {
+        'Gold': ("/oz", "🥇"),
+        'Silver': ("/oz", "🥈"),
+        'Oil_WTI': ("/barrel", "🛢️")
+    }
+
+    def __init__(self, background_refresh: bool = False):
         self.news_sources = {
             'marketwatch': 'https://feeds.marketwatch.com/marketwatch/marketpulse/',
             'reuters_business': 'http://feeds.reuters.com/reuters/businessNews',
@@ -132,12 +381,71 @@ class FinancialNewsAnalyzer:
             'USD/JPY': ['USDJPY', 'USD_JPY'],
             'DXY': ['DXY', 'USDX']
         }
-    # Cache for news and market data
-        self.news_cache = {}
-        self.market_cache = {}
+        # Cache for news and market data (entries expire after cache_timeout; bounded so varied keys can't grow it forever)
         self.cache_timeout = 300  # 5 minutes
-    def get_finviz_market_data(self):
-        """Get market data using finvizfinance library with improved data interpretation"""
+        # Expiry runs on the monotonic clock, so wall-clock jumps can't extend or cut short an entry
+        self.news_cache = TTLCache(maxsize=128, ttl=self.cache_timeout, timer=time.monotonic)
+        self.market_cache = TTLCache(maxsize=128, ttl=self.cache_timeout, timer=time.monotonic)
+        # TTLCache isn't thread-safe and the fetchers now run on worker threads
+        self._cache_lock = threading.RLock()
+        # yfinance Ticker objects reused across calls (keyed by Yahoo symbol)
+        self._ticker_cache = {}
+        
+        # Shared HTTP session: keep-alive connections are reused across feeds/APIs and worker threads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Background cache warmer (see start()): re-fetches shortly before entries expire so user requests stay cache hits
+        self._stop_refresh = threading.Event()
+        self._refresh_thread = None
+        self._start_lock = threading.Lock()
+        if background_refresh:
+            self.start()
+    
+    def start(self):
+        """Start the background cache warmer thread; later calls are no-ops"""
+        with self._start_lock:
+            if self._refresh_thread is not None:
+                return
+            self._refresh_thread = threading.Thread(target=self._refresh_loop, name="financial-news-refresh", daemon=True)
+            self._refresh_thread.start()
+    
+    def _refresh_loop(self):
+        """Refresh the default market symbols and headlines every cache_timeout - 30 seconds until close()"""
+        interval = max(self.cache_timeout - 30, 30)
+        while not self._stop_refresh.wait(interval):
+            try:
+                self.get_market_data(list(self.market_symbols.keys()), use_cache=False)
+                self.get_latest_financial_news(limit=10, use_cache=False)
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed: {e}")
+    
+    def close(self):
+        """Stop the background refresh thread and release pooled HTTP connections"""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+        self._session.close()
+    
+    def _ticker(self, yahoo_symbol: str):
+        """Return a memoized yfinance Ticker so its session and metadata are reused"""
+        ticker = self._ticker_cache.get(yahoo_symbol)
+        if ticker is None:
+            import yfinance as yf
+            ticker = self._ticker_cache[yahoo_symbol] = yf.Ticker(yahoo_symbol)
+        return ticker
+    
+    def get_finviz_market_data(self, symbols: Optional[List[str]] = None):
+        """Get market data using finvizfinance library with improved data interpretation
+        
+        When symbols is given, only those of our Finviz-backed symbols are looked up
+        """
         if not FINVIZ_AVAILABLE:
             return {}
             
@@ -154,6 +462,8 @@ class FinancialNewsAnalyzer:
                 'EUR/USD': 'FXE',   # Euro ETF
                 'DXY': 'UUP'        # Dollar ETF
             }
+            if symbols is not None:
+                target_symbols = {name: ticker for name, ticker in target_symbols.items() if name in symbols}
             
             for symbol_name, ticker in target_symbols.items():
                 try:
@@ -207,8 +517,6 @@ class FinancialNewsAnalyzer:
         futures_data = {}
         
         try:
-            import requests
-            
             # 1. Try Fixer.io for gold/silver (they have metal rates)
             try:
                 # Fixer.io has precious metals in their free tier
@@ -219,7 +527,7 @@ class FinancialNewsAnalyzer:
                     'symbols': 'XAU,XAG'  # Gold, Silver
                 }
                 
-                response = requests.get(fixer_url, params=params, timeout=10)
+                response = self._session.get(fixer_url, params=params, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     print(f"Fixer.io response: {data}")
@@ -255,7 +563,7 @@ class FinancialNewsAnalyzer:
                 # Get gold futures
                 if 'Gold_Futures' not in futures_data:
                     try:
-                        gold_ticker = yf.Ticker("GC=F")  # Gold futures
+                        gold_ticker = self._ticker("GC=F")  # Gold futures
                         gold_hist = gold_ticker.history(period="2d")
                         
                         if not gold_hist.empty and len(gold_hist) > 0:
@@ -280,7 +588,7 @@ class FinancialNewsAnalyzer:
                 # Get silver futures
                 if 'Silver_Futures' not in futures_data:
                     try:
-                        silver_ticker = yf.Ticker("SI=F")  # Silver futures
+                        silver_ticker = self._ticker("SI=F")  # Silver futures
                         silver_hist = silver_ticker.history(period="2d")
                         
                         if not silver_hist.empty and len(silver_hist) > 0:
@@ -305,7 +613,7 @@ class FinancialNewsAnalyzer:
                 # Get oil futures
                 if 'Oil_WTI_Futures' not in futures_data:
                     try:
-                        oil_ticker = yf.Ticker("CL=F")  # WTI Oil futures
+                        oil_ticker = self._ticker("CL=F")  # WTI Oil futures
                         oil_hist = oil_ticker.history(period="2d")
                         
                         if not oil_hist.empty and len(oil_hist) > 0:
@@ -517,7 +825,7 @@ class FinancialNewsAnalyzer:
             }
             
             url = finviz_urls.get(symbol_type, finviz_urls['forex'])
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self._session.get(url, headers=headers, timeout=15)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -630,53 +938,97 @@ class FinancialNewsAnalyzer:
     
     def get_free_market_data_alternative(self, symbol_name):
         """Get market data from free sources as fallback"""
-        try:
-            # Try CoinGecko for some data (free API)
-            if symbol_name in ['Bitcoin', 'Ethereum']:
-                crypto_ids = {'Bitcoin': 'bitcoin', 'Ethereum': 'ethereum'}
-                url = f"https://api.coingecko.com/api/v3/simple/price?ids={crypto_ids[symbol_name]}&vs_currencies=usd&include_24hr_change=true"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    crypto_data = list(data.values())[0]
-                    return {
-                        'price': round(crypto_data['usd'], 2),
-                        'change': 0.0,
-                        'change_percent': round(crypto_data.get('usd_24h_change', 0), 2),
-                        'timestamp': datetime.now().isoformat(),
-                        'source': 'coingecko'
-                    }
-            
-            # Try Exchangerate-API for forex (free tier)
-            elif '/' in symbol_name:
+        return self.get_free_market_data_bulk([symbol_name]).get(symbol_name)
+    
+    def get_free_market_data_bulk(self, symbol_names: List[str]) -> Dict:
+        """Get fallback market data for several symbols with one request per provider/base currency"""
+        crypto_symbols = [name for name in symbol_names if name in self._COINGECKO_IDS]
+        
+        # exchangerate-api returns every quote for a base, so group pairs by base currency
+        fx_by_base = {}
+        for symbol_name in symbol_names:
+            if '/' in symbol_name:
                 base, quote = symbol_name.split('/')
-                url = f"https://api.exchangerate-api.com/v4/latest/{base}"
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if quote in data['rates']:
-                        rate = data['rates'][quote]
-                        return {
-                            'price': round(rate, 4),
+                fx_by_base.setdefault(base, []).append((symbol_name, quote))
+        
+        jobs = [(self._get_coingecko_quotes, crypto_symbols)] if crypto_symbols else []
+        jobs.extend((self._get_exchangerate_quotes, base, pairs) for base, pairs in fx_by_base.items())
+        if not jobs:
+            return {}
+        if len(jobs) == 1:
+            fetch, *args = jobs[0]
+            return fetch(*args)
+        
+        market_data = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = [executor.submit(*job) for job in jobs]
+            for future in futures:
+                market_data.update(future.result())
+        return market_data
+    
+    def _get_coingecko_quotes(self, symbol_names: List[str]) -> Dict:
+        """Get prices for several cryptocurrencies from CoinGecko in one request"""
+        quotes = {}
+        try:
+            ids = ','.join(self._COINGECKO_IDS[name] for name in symbol_names)
+            url = f"https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd&include_24hr_change=true"
+            response = self._session.get(url, timeout=10)
+            if response.status_code == 200:
+                data = response.json()
+                for symbol_name in symbol_names:
+                    crypto_data = data.get(self._COINGECKO_IDS[symbol_name])
+                    if crypto_data:
+                        quotes[symbol_name] = {
+                            'price': round(crypto_data['usd'], 2),
+                            'change': 0.0,
+                            'change_percent': round(crypto_data.get('usd_24h_change', 0), 2),
+                            'timestamp': datetime.now().isoformat(),
+                            'source': 'coingecko'
+                        }
+        except Exception as e:
+            logger.warning(f"Error getting free market data for {', '.join(symbol_names)}: {e}")
+        return quotes
+    
+    def _get_exchangerate_quotes(self, base: str, pairs: List[tuple]) -> Dict:
+        """Get all FX pairs sharing a base currency from Exchangerate-API (free tier) in one request"""
+        quotes = {}
+        try:
+            url = f"https://api.exchangerate-api.com/v4/latest/{base}"
+            response = self._session.get(url, timeout=10)
+            if response.status_code == 200:
+                rates = response.json()['rates']
+                for symbol_name, quote in pairs:
+                    if quote in rates:
+                        quotes[symbol_name] = {
+                            'price': round(rates[quote], 4),
                             'change': 0.0,
                             'change_percent': 0.0,
                             'timestamp': datetime.now().isoformat(),
                             'source': 'exchangerate-api'
                         }
-            
-            return None
-            
         except Exception as e:
-            logger.warning(f"Error getting free market data for {symbol_name}: {e}")
-            return None
+            logger.warning(f"Error getting free market data for {base} pairs: {e}")
+        return quotes
+        
+    def get_latest_financial_news(self, limit: int = 10, include_market_overview: bool = False,
+                                  use_cache: bool = True) -> Dict:
+        """Get latest financial news from multiple sources including enhanced Finviz data
         
-    def get_latest_financial_news(self, limit: int = 10, include_market_overview: bool = False) -> Dict:
-        """Get latest financial news from multiple sources including enhanced Finviz data"""
+        use_cache=False always fetches (the result still replaces the cached entry)
+        """
         cache_key = f"financial_news_{limit}_{include_market_overview}"
         
-        # Check cache first
-        if self._is_cache_valid(cache_key, self.news_cache):
-            return self.news_cache[cache_key]['data']
+        if use_cache:
+            # Check cache first
+            with self._cache_lock:
+                cached = self.news_cache.get(cache_key)
+            if cached is not None:
+                return cached['data']
+            
+            # A fresh result fetched with a larger limit already covers this request
+            cached_result = self._get_cached_news_superset(limit, include_market_overview)
+            if cached_result is not None:
+                return cached_result
             
         all_news = []
         market_overview = {}
@@ -701,28 +1053,23 @@ class FinancialNewsAnalyzer:
             if len(all_news) < limit:
                 remaining_needed = limit - len(all_news)
                 
-                for source_name, feed_url in list(self.news_sources.items())[:3]:  # Increased from 2 to 3 sources
+                # Download and parse the feeds concurrently, then build items in source order
+                feeds = list(self.news_sources.items())[:3]  # Increased from 2 to 3 sources
+                items_per_source = max(2, remaining_needed // 3)  # At least 2 items per source
+                with ThreadPoolExecutor(max_workers=len(feeds)) as executor:
+                    futures = [
+                        executor.submit(self._fetch_feed_items, source_name, feed_url, items_per_source)
+                        for source_name, feed_url in feeds
+                    ]
+                    feed_items = [future.result() for future in futures]
+                
+                for (source_name, _), items in zip(feeds, feed_items):
                     try:
-                        response = requests.get(feed_url, timeout=15)  # Increased timeout
-                        response.raise_for_status()
-                        
-                        # Parse RSS XML
-                        root = ET.fromstring(response.content)
-                        
-                        # Find all item/entry elements
-                        items = root.findall('.//item') or root.findall('.//entry')
-                        
-                        items_per_source = max(2, remaining_needed // 3)  # At least 2 items per source
-                        for item in items[:items_per_source]:
-                            title_elem = item.find('title')
-                            desc_elem = item.find('description') or item.find('summary')
-                            link_elem = item.find('link')
-                            date_elem = item.find('pubDate') or item.find('published')
-                            
-                            title = title_elem.text if title_elem is not None else 'No title'
-                            summary = desc_elem.text if desc_elem is not None else title  # Use title if no summary
-                            url = link_elem.text if link_elem is not None else ''
-                            published = date_elem.text if date_elem is not None else ''
+                        for fields in items:
+                            title = fields.get('title') or 'No title'
+                            summary = fields.get('description') or fields.get('summary') or title  # Use title if no summary
+                            url = fields.get('link') or ''
+                            published = fields.get('pubDate') or fields.get('published') or ''
                             
                             # Clean HTML from summary
                             if summary:
@@ -746,6 +1093,13 @@ class FinancialNewsAnalyzer:
                     except Exception as e:
                         logger.warning(f"Failed to get news from {source_name}: {e}")
                         
+            # Truncate summaries once here rather than on every report render, and lowercase
+            # the searchable text once for the keyword classifiers ('_lc' is internal only)
+            for news_item in all_news:
+                summary = news_item.get('summary') or ''
+                news_item['summary_short'] = f"{summary[:147]}..." if len(summary) > 150 else summary
+                news_item['_lc'] = f"{news_item['title']} {summary}".lower()
+            
             # Sort by relevance to FX/trading
             all_news = self._filter_fx_relevant_news(all_news)
             
@@ -756,10 +1110,12 @@ class FinancialNewsAnalyzer:
             }
             
             # Cache the results
-            self.news_cache[cache_key] = {
-                'data': result,
-                'timestamp': datetime.now()
-            }
+            with self._cache_lock:
+                self.news_cache[cache_key] = {
+                    'data': result,
+                    'limit': limit,
+                    'include_market_overview': include_market_overview
+                }
             
             return result
             
@@ -767,27 +1123,45 @@ class FinancialNewsAnalyzer:
             logger.error(f"Error getting financial news: {e}")
             return {'news': [], 'market_overview': {}}
             
+    def _fetch_feed_items(self, source_name: str, feed_url: str, limit: int,
+                          tags: Tuple[str, ...] = ('item', 'entry'), timeout: int = 15) -> List[Dict]:
+        """Download one feed and return the fields of its first `limit` items (empty on failure)
+        
+        The body is parsed straight off the socket and the download stops once enough items are read
+        """
+        try:
+            with self._session.get(feed_url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                # Have urllib3 undo gzip/deflate so the parser sees plain XML
+                response.raw.decode_content = True
+                return list(itertools.islice(self._iter_feed_items(response.raw, tags), limit))
+        except Exception as e:
+            logger.warning(f"Failed to get news from {source_name}: {e}")
+            return []
+            
+    def _iter_feed_items(self, stream, tags: Tuple[str, ...] = ('item', 'entry')):
+        """Yield {child tag: text} for each feed item/entry as it is parsed (first child wins per tag)"""
+        for _, elem in ET.iterparse(stream, events=('end',)):
+            if elem.tag in tags:
+                fields = {}
+                for child in elem:
+                    fields.setdefault(child.tag, child.text)
+                # Free the item's subtree before parsing further
+                elem.clear()
+                yield fields
+            
     def _get_yahoo_finance_news(self, limit: int = 5) -> List[Dict]:
         """Get news specifically from Yahoo Finance"""
         try:
             # Use Yahoo Finance RSS feed
-            response = requests.get(self.news_sources['yahoo_finance'], timeout=10)
-            response.raise_for_status()
-            
-            root = ET.fromstring(response.content)
-            items = root.findall('.//item')
+            items = self._fetch_feed_items('Yahoo Finance', self.news_sources['yahoo_finance'], limit, ('item',), timeout=10)
             news_items = []
             
-            for item in items[:limit]:
-                title_elem = item.find('title')
-                desc_elem = item.find('description')
-                link_elem = item.find('link')
-                date_elem = item.find('pubDate')
-                
-                title = title_elem.text if title_elem is not None else 'No title'
-                summary = desc_elem.text if desc_elem is not None else 'No summary'
-                url = link_elem.text if link_elem is not None else ''
-                published = date_elem.text if date_elem is not None else ''
+            for fields in items:
+                title = fields.get('title') or 'No title'
+                summary = fields.get('description') or 'No summary'
+                url = fields.get('link') or ''
+                published = fields.get('pubDate') or ''
                 
                 if summary:
                     summary = self._clean_html(summary)
@@ -807,32 +1181,50 @@ class FinancialNewsAnalyzer:
             logger.error(f"Error getting Yahoo Finance news: {e}")
             return []
             
-    def get_market_data(self, symbols: Optional[List[str]] = None) -> Dict:
-        """Get current market data for FX pairs and commodities using Finviz and free sources"""
+    def get_market_data(self, symbols: Optional[List[str]] = None, use_cache: bool = True) -> Dict:
+        """Get current market data for FX pairs and commodities using Finviz and free sources
+        
+        use_cache=False re-fetches every symbol (the results still replace the cached entries)
+        """
         if not symbols:
             symbols = list(self.market_symbols.keys())
             
-        cache_key = f"market_data_{'-'.join(symbols)}"
+        # Order-independent key, so ['DXY', 'Gold'] and ['Gold', 'DXY'] share an entry
+        cache_key = f"market_data_{','.join(sorted(set(symbols)))}"
         
-        # Check cache
-        if self._is_cache_valid(cache_key, self.market_cache):
-            return self.market_cache[cache_key]['data']
+        # Check cache: the exact symbol set first, then per-symbol entries left by earlier fetches
+        cached = None
+        single_entries = [None] * len(symbols)
+        if use_cache:
+            with self._cache_lock:
+                cached = self.market_cache.get(cache_key)
+                single_entries = [self.market_cache.get(f"market_data_single_{symbol_name}") for symbol_name in symbols]
+        if cached is not None:
+            return cached['data']
+        
+        # Reuse fresh per-symbol entries and only fetch the symbols that have none
+        cached_data = {symbol_name: entry['data'] for symbol_name, entry in zip(symbols, single_entries) if entry}
+        to_fetch = [symbol_name for symbol_name in symbols if symbol_name not in cached_data]
+        if not to_fetch:
+            return cached_data
             
         market_data = {}
         
         # First try Finviz data
         if FINVIZ_AVAILABLE:
             try:
-                finviz_data = self.get_finviz_market_data()
+                finviz_data = self.get_finviz_market_data(to_fetch)
                 market_data.update(finviz_data)
             except Exception as e:
                 logger.warning(f"Finviz data failed: {e}")
         
-        # Fill missing data with free alternatives
-        for symbol_name in symbols:
-            if symbol_name not in market_data:
-                # Try free alternative sources
-                free_data = self.get_free_market_data_alternative(symbol_name)
+        # Fill missing data with free alternatives, batched per provider and fetched concurrently
+        missing = [symbol_name for symbol_name in to_fetch if symbol_name not in market_data]
+        if missing:
+            free_results = self.get_free_market_data_bulk(missing)
+            
+            for symbol_name in missing:
+                free_data = free_results.get(symbol_name)
                 if free_data:
                     market_data[symbol_name] = free_data
                 else:
@@ -843,12 +1235,13 @@ class FinancialNewsAnalyzer:
         
         # Cache the results
         if market_data:
-            self.market_cache[cache_key] = {
-                'data': market_data,
-                'timestamp': datetime.now()
-            }
+            with self._cache_lock:
+                for symbol_name, symbol_data in market_data.items():
+                    self.market_cache[f"market_data_single_{symbol_name}"] = {'data': symbol_data}
+                market_data = {**cached_data, **market_data}
+                self.market_cache[cache_key] = {'data': market_data}
         
-        return market_data
+        return market_data or cached_data
     
     def get_sample_market_data(self, symbol_name):
         """Provide realistic sample market data when APIs fail"""
@@ -884,15 +1277,11 @@ class FinancialNewsAnalyzer:
     def get_currency_analysis(self, base_currency: str = "USD") -> Dict:
         """Get comprehensive currency analysis"""
         try:
-            # Get major FX pairs data
-            fx_pairs = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD']
-            market_data = self.get_market_data(fx_pairs)
-            
-            # Get DXY (Dollar Index)
-            dxy_data = self.get_market_data(['DXY'])
-            
-            # Get gold price (inverse correlation with USD)
-            gold_data = self.get_market_data(['Gold'])
+            # Major FX pairs, DXY (Dollar Index) and gold (inverse correlation with USD) in one fetch
+            data = self.get_market_data([*self._FX_PAIRS, 'DXY', 'Gold'])
+            market_data = {pair: data[pair] for pair in self._FX_PAIRS if pair in data}
+            dxy_data = {'DXY': data.get('DXY', {})}
+            gold_data = {'Gold': data.get('Gold', {})}
             
             analysis = {
                 'base_currency': base_currency,
@@ -993,58 +1382,36 @@ class FinancialNewsAnalyzer:
                 'overall_sentiment': 'neutral'
             }
             
-            # Keywords for impact classification
-            high_impact_keywords = [
-                'federal reserve', 'fed', 'interest rate', 'inflation', 'gdp',
-                'unemployment', 'central bank', 'monetary policy', 'recession',
-                'economic growth', 'trade war', 'geopolitical', 'crisis'
-            ]
-            
-            medium_impact_keywords = [
-                'earnings', 'economic data', 'manufacturing', 'consumer confidence',
-                'retail sales', 'housing', 'crude oil', 'gold price', 'dollar'
-            ]
-            
-            fx_keywords = [
-                'currency', 'forex', 'fx', 'dollar', 'euro', 'pound', 'yen',
-                'exchange rate', 'central bank', 'monetary policy'
-            ]
-            
-            gold_keywords = [
-                'gold', 'precious metals', 'inflation', 'safe haven',
-                'economic uncertainty', 'geopolitical tension'
-            ]
-            
             positive_sentiment_count = 0
             negative_sentiment_count = 0
             
             for news in news_items:
-                title_lower = news['title'].lower()
-                summary_lower = news.get('summary', '').lower()
-                full_text = f"{title_lower} {summary_lower}"
+                full_text = self._lowered_text(news)
+                
+                # One scan finds every keyword; count distinct hits per category
+                category_hits = Counter(
+                    category for keyword in _IMPACT_SCAN(full_text) for category in _IMPACT_KEYWORD_TAGS[keyword]
+                )
                 
                 # Classify impact level
-                if any(keyword in full_text for keyword in high_impact_keywords):
+                if category_hits['high']:
                     impact_analysis['high_impact'].append(news)
-                elif any(keyword in full_text for keyword in medium_impact_keywords):
+                elif category_hits['medium']:
                     impact_analysis['medium_impact'].append(news)
                 else:
                     impact_analysis['low_impact'].append(news)
                 
                 # Check FX relevance
-                if any(keyword in full_text for keyword in fx_keywords):
+                if category_hits['fx']:
                     impact_analysis['fx_relevant'].append(news)
                     
                 # Check gold relevance
-                if any(keyword in full_text for keyword in gold_keywords):
+                if category_hits['gold']:
                     impact_analysis['gold_relevant'].append(news)
                     
-                # Simple sentiment analysis
-                positive_words = ['up', 'rise', 'gain', 'growth', 'positive', 'strong', 'boost']
-                negative_words = ['down', 'fall', 'decline', 'weak', 'negative', 'drop', 'crisis']
-                
-                positive_score = sum(1 for word in positive_words if word in full_text)
-                negative_score = sum(1 for word in negative_words if word in full_text)
+                # Simple sentiment analysis: number of distinct positive/negative words present
+                positive_score = category_hits['positive']
+                negative_score = category_hits['negative']
                 
                 if positive_score > negative_score:
                     positive_sentiment_count += 1
@@ -1078,18 +1445,12 @@ class FinancialNewsAnalyzer:
             commodities_analysis = self.get_commodities_analysis()
             news_impact = self.analyze_news_impact(news)
             
-            # Generate insights with enhanced analysis
-            insights = []
-            insights.append("📊 **Current Market Analysis & Trading Insights**\n")
-            
-            # Market overview with intelligent interpretation
-            dxy_analysis = ""
-            gold_analysis = ""
+            # Build each section, then fill the template once
+            dxy_block = ""
+            gold_block = ""
             
             if currency_analysis.get('dollar_index'):
-                dxy = currency_analysis['dollar_index']
-                price = dxy.get('price', 'N/A')
-                change_pct = dxy.get('change_percent', 0)
+                price, change_pct = MarketPoint.from_quote(currency_analysis['dollar_index'])
                 
                 # Intelligent USD analysis
                 if abs(change_pct) > 0.5:
@@ -1100,13 +1461,10 @@ class FinancialNewsAnalyzer:
                     strength = "stable"
                     dxy_analysis = "USD showing consolidation - watch for breakout direction."
                     
-                insights.append(f"💵 **US Dollar Index (DXY)**: {price} ({change_pct:+.2f}%) - USD {strength}")
-                insights.append(f"   💡 {dxy_analysis}")
+                dxy_block = f"\n💵 **US Dollar Index (DXY)**: {price} ({change_pct:+.2f}%) - USD {strength}\n   💡 {dxy_analysis}"
                 
             if commodities_analysis.get('commodities', {}).get('Gold'):
-                gold = commodities_analysis['commodities']['Gold']
-                price = gold.get('price', 'N/A')
-                change_pct = gold.get('change_percent', 0)
+                price, change_pct = MarketPoint.from_quote(commodities_analysis['commodities']['Gold'])
                 
                 # Intelligent gold analysis
                 if abs(change_pct) > 1.0:
@@ -1117,35 +1475,27 @@ class FinancialNewsAnalyzer:
                 else:
                     gold_analysis = "Gold in consolidation phase. Monitor for breakout signals."
                     
-                insights.append(f"🥇 **Gold**: ${price}/oz ({change_pct:+.2f}%)")
-                insights.append(f"   💡 {gold_analysis}")
+                gold_block = f"\n🥇 **Gold**: ${price}/oz ({change_pct:+.2f}%)\n   💡 {gold_analysis}"
                 
             # Enhanced FX pairs analysis
-            insights.append("\n🔄 **Major FX Pairs Analysis:**")
             fx_data = currency_analysis.get('fx_pairs', {}) or commodities_analysis.get('commodities', {})
-            
-            strongest_pairs = []
-            weakest_pairs = []
-            
-            for pair, data in list(fx_data.items())[:6]:
-                price = data.get('price', 'N/A')
-                change_pct = data.get('change_percent', 0)
-                emoji = "🟢" if change_pct > 0.3 else "🔴" if change_pct < -0.3 else "⚪"
-                
-                insights.append(f"{emoji} **{pair}**: {price} ({change_pct:+.2f}%)")
-                
-                if change_pct > 0.5:
-                    strongest_pairs.append(pair)
-                elif change_pct < -0.5:
-                    weakest_pairs.append(pair)
+            fx_points = [(pair, MarketPoint.from_quote(data)) for pair, data in list(fx_data.items())[:6]]
+            fx_block = "".join(
+                f"\n{'🟢' if point.change_pct > 0.3 else '🔴' if point.change_pct < -0.3 else '⚪'} "
+                f"**{pair}**: {point.price} ({point.change_pct:+.2f}%)"
+                for pair, point in fx_points
+            )
+            strongest_pairs = [pair for pair, point in fx_points if point.change_pct > 0.5]
+            weakest_pairs = [pair for pair, point in fx_points if point.change_pct < -0.5]
             
             # Trading opportunities based on momentum
+            opportunities_block = ""
             if strongest_pairs or weakest_pairs:
-                insights.append(f"\n🎯 **Trading Opportunities:**")
+                opportunities_block = "\n\n🎯 **Trading Opportunities:**"
                 if strongest_pairs:
-                    insights.append(f"• **Momentum plays**: {', '.join(strongest_pairs[:2])} showing bullish momentum")
+                    opportunities_block += f"\n• **Momentum plays**: {', '.join(strongest_pairs[:2])} showing bullish momentum"
                 if weakest_pairs:
-                    insights.append(f"• **Reversal watch**: {', '.join(weakest_pairs[:2])} may be oversold")
+                    opportunities_block += f"\n• **Reversal watch**: {', '.join(weakest_pairs[:2])} may be oversold"
                 
             # Market sentiment with news-based analysis
             sentiment = news_impact.get('overall_sentiment', 'neutral')
@@ -1161,105 +1511,103 @@ class FinancialNewsAnalyzer:
                 sentiment_note = f"FX-focused news flow ({fx_relevant_count} items) - currency movements likely"
             else:
                 sentiment_note = "Moderate news flow - normal trading conditions"
-                
-            insights.append(f"\n{sentiment_emoji} **Market Sentiment**: {sentiment.title()}")
-            insights.append(f"   � {sentiment_note}")
             
             # Key market movers with better context
+            drivers_block = ""
             high_impact_news = news_impact.get('high_impact', [])
             if high_impact_news:
-                insights.append(f"\n⚠️ **Key Market Drivers:**")
+                driver_lines = ["\n\n⚠️ **Key Market Drivers:**"]
                 for news_item in high_impact_news[:2]:
                     title = news_item['title'][:90] + "..." if len(news_item['title']) > 90 else news_item['title']
-                    insights.append(f"• {title}")
+                    driver_lines.append(f"\n• {title}")
                     
                     # Add trading implication
-                    title_lower = title.lower()
-                    if any(word in title_lower for word in ['fed', 'rate', 'inflation']):
-                        insights.append(f"  💱 Likely to impact USD pairs and bonds")
-                    elif any(word in title_lower for word in ['china', 'trade', 'tariff']):
-                        insights.append(f"  💱 May affect CNY, AUD, commodity currencies")
-                    elif any(word in title_lower for word in ['oil', 'energy', 'crude']):
-                        insights.append(f"  💱 Watch CAD, NOK, and energy-related pairs")
+                    driver_topics = {_MARKET_DRIVER_TOPICS[word] for word in _MARKET_DRIVER_RE.findall(title.lower())}
+                    for topic in ('rates', 'china', 'oil'):
+                        if topic in driver_topics:
+                            driver_lines.append(_DRIVER_IMPLICATIONS[topic])
+                            break
+                drivers_block = "".join(driver_lines)
                         
             # Session-specific trading advice
             from datetime import datetime, timezone
             now_utc = datetime.now(timezone.utc)
             current_hour = now_utc.hour
             
-            insights.append(f"\n💡 **Session-Specific Strategy:**")
-            
             if 13 <= current_hour <= 17:  # London/NY overlap
-                insights.append("• **Prime time**: London/NY overlap - highest liquidity for major pairs")
-                insights.append("• **Focus**: EUR/USD, GBP/USD, USD/JPY for best execution")
-                insights.append("• **Strategy**: Breakout trades and news-based momentum")
+                session = 'overlap'
             elif 0 <= current_hour <= 9:  # Asian session
-                insights.append("• **Asian session**: Lower volatility, range-bound trading")
-                insights.append("• **Focus**: AUD/USD, USD/JPY, NZD/USD most active")
-                insights.append("• **Strategy**: Range trading, carry trades")
+                session = 'asian'
             elif 9 <= current_hour <= 17:  # London session
-                insights.append("• **London session**: European focus, moderate volatility")
-                insights.append("• **Focus**: EUR/USD, GBP/USD, EUR/GBP")
-                insights.append("• **Strategy**: Trend following, economic data trades")
+                session = 'london'
             else:
-                insights.append("• **Off-hours trading**: Lower liquidity, wider spreads")
-                insights.append("• **Caution**: Avoid large positions, watch for gaps")
+                session = 'off_hours'
             
             # Risk management advice based on current conditions
-            insights.append(f"\n⚖️ **Risk Management:**")
-            
             volatility_level = "high" if high_impact_count > 2 else "moderate" if fx_relevant_count > 2 else "low"
             
-            if volatility_level == "high":
-                insights.append("• **High volatility expected**: Reduce position sizes by 30-50%")
-                insights.append("• **Tight stops**: Use closer stop losses due to news-driven moves")
-            elif volatility_level == "moderate":
-                insights.append("• **Moderate volatility**: Standard position sizing appropriate")
-                insights.append("• **Watch key levels**: Respect major support/resistance")
-            else:
-                insights.append("• **Low volatility**: Can use wider stops, consider range strategies")
-                insights.append("• **Patience required**: Wait for clear setups in quiet markets")
-                
-            # Economic calendar reminder
-            insights.append("• **Economic calendar**: Check for upcoming releases (NFP, CPI, Fed minutes)")
-            insights.append("• **Central bank watch**: Monitor Fed, ECB, BOJ communications")
-            
-            # Disclaimer with AI note
-            insights.append(f"\n⚠️ **Disclaimer**: AI-enhanced analysis based on real market data and news. Not financial advice. Always verify information and consult professionals before trading.")
-            
-            return "\n".join(insights)
+            return _TRADING_INSIGHTS_TEMPLATE.format_map({
+                'dxy_block': dxy_block,
+                'gold_block': gold_block,
+                'fx_block': fx_block,
+                'opportunities_block': opportunities_block,
+                'sentiment_emoji': sentiment_emoji,
+                'sentiment': sentiment.title(),
+                'sentiment_note': sentiment_note,
+                'drivers_block': drivers_block,
+                'session_block': _SESSION_ADVICE[session],
+                'risk_block': _RISK_ADVICE[volatility_level]
+            })
             
         except Exception as e:
             logger.error(f"Error generating enhanced trading insights: {e}")
             return "📊 Unable to generate market insights at this time. Please try again later."
             
+    # Awaitable variants for async callers (e.g. the Telegram bot). The blocking fetch runs in a
+    # worker thread so the event loop keeps serving other chats and independent fetches can be gathered
+    async def get_latest_financial_news_async(self, limit: int = 10, include_market_overview: bool = False) -> Dict:
+        return await asyncio.to_thread(self.get_latest_financial_news, limit, include_market_overview)
+        
+    async def get_market_data_async(self, symbols: Optional[List[str]] = None) -> Dict:
+        return await asyncio.to_thread(self.get_market_data, symbols)
+        
+    async def get_currency_analysis_async(self, base_currency: str = "USD") -> Dict:
+        return await asyncio.to_thread(self.get_currency_analysis, base_currency)
+        
+    async def get_commodities_analysis_async(self) -> Dict:
+        return await asyncio.to_thread(self.get_commodities_analysis)
+        
+    async def get_trading_insights_async(self, user_query: str = "") -> str:
+        return await asyncio.to_thread(self.get_trading_insights, user_query)
+            
     def _get_query_specific_insights(self, query: str, currency_data: Dict, commodities_data: Dict, news_impact: Dict) -> str:
         """Generate insights specific to user's query"""
-        query_lower = query.lower()
+        # Tokenize once; each route is then a set lookup instead of substring scans
+        query_tokens = frozenset(_QUERY_TOKEN_RE.findall(query.lower()))
         
         try:
             # Currency specific queries
-            if any(curr in query_lower for curr in ['usd', 'dollar', 'eur', 'euro', 'gbp', 'pound']):
-                if 'usd' in query_lower or 'dollar' in query_lower:
+            if query_tokens & self._CURRENCY_QUERY_WORDS:
+                if query_tokens & {'usd', 'dollar', 'dollars'}:
                     dxy = currency_data.get('dollar_index', {})
                     if dxy:
                         return f"USD showing {dxy.get('change_percent', 0):+.2f}% change. Consider USD strength in your trades."
                         
             # Gold specific queries
-            if 'gold' in query_lower:
+            if 'gold' in query_tokens:
                 gold = commodities_data.get('commodities', {}).get('Gold', {})
                 if gold:
                     gold_relevant_news = len(news_impact.get('gold_relevant', []))
                     return f"Gold at ${gold.get('price', 'N/A')} ({gold.get('change_percent', 0):+.2f}%). {gold_relevant_news} related news items detected."
                     
             # Oil queries
-            if 'oil' in query_lower or 'crude' in query_lower:
+            if query_tokens & self._OIL_QUERY_WORDS:
                 oil = commodities_data.get('commodities', {}).get('Oil_WTI', {})
                 if oil:
                     return f"WTI Crude at ${oil.get('price', 'N/A')} ({oil.get('change_percent', 0):+.2f}%). Monitor for energy sector impacts."
                     
             # Market trend queries
-            if any(word in query_lower for word in ['trend', 'direction', 'forecast']):
+            if query_tokens & self._TREND_QUERY_WORDS:
                 sentiment = news_impact.get('overall_sentiment', 'neutral')
                 return f"Current market sentiment is {sentiment}. Consider this in your trend analysis."
                 
@@ -1412,22 +1760,13 @@ class FinancialNewsAnalyzer:
             
     def _filter_fx_relevant_news(self, news_items: List[Dict]) -> List[Dict]:
         """Filter and prioritize FX-relevant news"""
-        fx_keywords = [
-            'currency', 'forex', 'fx', 'dollar', 'euro', 'pound', 'yen',
-            'federal reserve', 'fed', 'ecb', 'boe', 'boj', 'central bank',
-            'interest rate', 'inflation', 'gdp', 'economic', 'trade',
-            'monetary policy', 'employment', 'consumer price'
-        ]
-        
         scored_news = []
         
         for news in news_items:
-            title_lower = news['title'].lower()
-            summary_lower = news.get('summary', '').lower()
-            full_text = f"{title_lower} {summary_lower}"
+            full_text = self._lowered_text(news)
             
             # Calculate relevance score
-            score = sum(1 for keyword in fx_keywords if keyword in full_text)
+            score = len(_FX_RELEVANCE_SCAN(full_text))
             
             scored_news.append({
                 'news': news,
@@ -1439,19 +1778,36 @@ class FinancialNewsAnalyzer:
         
         return [item['news'] for item in scored_news]
         
+    def _lowered_text(self, news: Dict) -> str:
+        """Lowercased 'title summary' text of a news item, reusing the '_lc' field when present"""
+        full_text = news.get('_lc')
+        if full_text is None:
+            full_text = f"{news['title']} {news.get('summary', '')}".lower()
+        return full_text
+        
     def _clean_html(self, text: str) -> str:
         """Clean HTML tags from text"""
-        import re
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', text)
+        return _HTML_TAG_RE.sub('', text)
         
-    def _is_cache_valid(self, cache_key: str, cache_dict: Dict) -> bool:
-        """Check if cached data is still valid"""
-        if cache_key not in cache_dict:
-            return False
-            
-        cache_time = cache_dict[cache_key]['timestamp']
-        return (datetime.now() - cache_time).seconds < self.cache_timeout
+    def _get_cached_news_superset(self, limit: int, include_market_overview: bool) -> Optional[Dict]:
+        """Serve a news request from a fresh cached fetch made with a larger limit
+        
+        get_enhanced_market_analysis (limit=5) and get_enhanced_trading_insights (limit=8)
+        are usually rendered back-to-back, so the second call can reuse the first fetch.
+        """
+        with self._cache_lock:
+            # get() skips entries that expired since the last eviction pass
+            entries = [self.news_cache.get(cache_key) for cache_key in list(self.news_cache)]
+        for entry in entries:
+            if (entry is not None
+                    and entry.get('include_market_overview') == include_market_overview
+                    and entry.get('limit', 0) >= limit):
+                cached = entry['data']
+                return {
+                    'news': cached['news'][:limit],
+                    'market_overview': cached['market_overview']
+                }
+        return None
     
     def _extract_article_content(self, url: str, max_paragraphs: int = 3) -> str:
         """Extract article content from URL for preview"""
@@ -1460,7 +1816,7 @@ class FinancialNewsAnalyzer:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             # Try to parse with BeautifulSoup if available
@@ -1673,7 +2029,7 @@ class FinancialNewsAnalyzer:
             crypto_ids = ['bitcoin', 'ethereum', 'binancecoin', 'cardano', 'solana']
             url = f"https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&ids={','.join(crypto_ids)}&order=market_cap_desc&per_page=5&page=1&sparkline=false&price_change_percentage=24h"
             
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 crypto_data = {}
@@ -1703,7 +2059,7 @@ class FinancialNewsAnalyzer:
             commodities_ids = ['pax-gold', 'silver-tokenized-stock-ftx']  # These are tokenized precious metals
             url = f"https://api.coingecko.com/api/v3/simple/price?ids={','.join(commodities_ids)}&vs_currencies=usd&include_24hr_change=true"
             
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 commodities_data = {}
@@ -1727,8 +2083,7 @@ class FinancialNewsAnalyzer:
                 
                 # For WTI Oil, use the existing Yahoo Finance method as CoinGecko doesn't have direct oil futures
                 try:
-                    import yfinance as yf
-                    oil_ticker = yf.Ticker("CL=F")  # WTI Crude Oil futures
+                    oil_ticker = self._ticker("CL=F")  # WTI Crude Oil futures
                     oil_hist = oil_ticker.history(period="2d")
                     
                     if not oil_hist.empty and len(oil_hist) > 0:
@@ -1771,7 +2126,7 @@ class FinancialNewsAnalyzer:
             # Get real data from Yahoo Finance
             for name, symbol in indices_symbols.items():
                 try:
-                    ticker = yf.Ticker(symbol)
+                    ticker = self._ticker(symbol)
                     hist = ticker.history(period="2d")
                     
                     if not hist.empty and len(hist) > 0:
@@ -1892,9 +2247,6 @@ class FinancialNewsAnalyzer:
             }
         
         # Analyze headlines for sentiment keywords
-        bullish_keywords = ['rise', 'gain', 'surge', 'rally', 'boost', 'up', 'strong', 'growth', 'positive']
-        bearish_keywords = ['fall', 'drop', 'decline', 'crash', 'weak', 'down', 'loss', 'negative', 'concern']
-        
         bullish_count = 0
         bearish_count = 0
         themes = set()
@@ -1902,26 +2254,11 @@ class FinancialNewsAnalyzer:
         for item in news_items:
             title = item.get('title', '').lower()
             
-            # Count sentiment words
-            for word in bullish_keywords:
-                if word in title:
-                    bullish_count += 1
-            
-            for word in bearish_keywords:
-                if word in title:
-                    bearish_count += 1
-            
-            # Extract themes
-            if 'fed' in title or 'federal' in title or 'interest' in title:
-                themes.add('Federal Reserve Policy')
-            if 'inflation' in title:
-                themes.add('Inflation')
-            if 'employment' in title or 'jobs' in title:
-                themes.add('Employment')
-            if 'earnings' in title:
-                themes.add('Corporate Earnings')
-            if 'trade' in title or 'tariff' in title:
-                themes.add('Trade Relations')
+            # One scan per headline; tally distinct sentiment words and collect themes
+            tag_hits = Counter(tag for word in _HEADLINE_SCAN(title) for tag in _HEADLINE_KEYWORD_TAGS[word])
+            bullish_count += tag_hits['bullish']
+            bearish_count += tag_hits['bearish']
+            themes.update(theme for theme, _ in NEWS_THEME_KEYWORDS if tag_hits[theme])
         
         # Determine overall sentiment
         if bullish_count > bearish_count * 1.5:
@@ -1949,10 +2286,9 @@ class FinancialNewsAnalyzer:
         insights = []
         
         # USD strength analysis
-        usd_pairs = ['EUR/USD', 'GBP/USD', 'AUD/USD']
         usd_strength = 0
         
-        for pair in usd_pairs:
+        for pair in self._USD_STRENGTH_PAIRS:
             if pair in market_data:
                 change = market_data[pair].get('change_percent', 0)
                 usd_strength -= change  # Negative change in these pairs = USD strength
@@ -2014,7 +2350,7 @@ class FinancialNewsAnalyzer:
         if not news_items:
             return "❌ No financial news available at the moment"
         
-        report = "📰 **LATEST FINANCIAL NEWS**\n\n"
+        report = _NEWS_HEADER
         
         for i, item in enumerate(news_items, 1):
             title = item.get('title', 'No title')
@@ -2038,10 +2374,11 @@ class FinancialNewsAnalyzer:
             report += f"{i}. **{title}**\n"
             
             if summary and summary != title:
-                # Truncate summary if too long
-                if len(summary) > 150:
-                    summary = summary[:147] + "..."
-                report += f"📝 {summary}\n"
+                # Truncated summary is precomputed at ingest; fall back for other sources
+                summary_short = item.get('summary_short')
+                if summary_short is None:
+                    summary_short = f"{summary[:147]}..." if len(summary) > 150 else summary
+                report += f"📝 {summary_short}\n"
             
             if time_str:
                 report += f"📅 {time_str}\n"
@@ -2051,7 +2388,7 @@ class FinancialNewsAnalyzer:
             
             report += f"📊 Source: {source}\n\n"
         
-        report += "💡 *Want more? Ask for 'market analysis' or 'trading insights'*"
+        report += _NEWS_FOOTER
         return report
 
     def get_enhanced_market_analysis(self) -> str:
@@ -2063,70 +2400,52 @@ class FinancialNewsAnalyzer:
             market_data = self.get_market_data()
             
             # Get latest news for context
-            news_items = self.get_latest_financial_news(limit=5)
+            news_result = self.get_latest_financial_news(limit=5)
+            news_items = news_result.get('news', []) if isinstance(news_result, dict) else news_result
             
-            analysis = "📊 **COMPREHENSIVE MARKET ANALYSIS**\n\n"
+            # Lowercase titles and summaries once for all keyword detectors
+            lowered_news = [(item.get('title', '').lower(), item.get('summary', '').lower()) for item in news_items]
+            
+            analysis = _ANALYSIS_HEADER
+            
+            # Extract (price, change %) once for every symbol used below
+            fx_quotes = {}
+            comm_quotes = {}
+            dxy_quote = None
+            for symbol, data in market_data.items():
+                if symbol in self._FX_SET:
+                    fx_quotes[symbol] = (data.get('price', 0), data.get('change_percent', 0))
+                elif symbol in self._COMM_SET:
+                    comm_quotes[symbol] = (data.get('price', 0), data.get('change_percent', 0))
+                elif symbol == 'DXY':
+                    dxy_quote = (data.get('price', 0), data.get('change_percent', 0))
             
             # Major FX Pairs Analysis
-            analysis += "💱 **MAJOR FX PAIRS:**\n"
-            fx_pairs = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'USD/CHF', 'AUD/USD', 'USD/CAD']
+            analysis += _FX_HEADER
             
-            for pair in fx_pairs:
-                if pair in market_data:
-                    data = market_data[pair]
-                    price = data.get('price', 0)
-                    change_pct = data.get('change_percent', 0)
+            for pair in self._FX_PAIRS:
+                if pair in fx_quotes:
+                    price, change_pct = fx_quotes[pair]
                     
                     # Determine trend emoji
-                    if change_pct > 0.25:
-                        trend = "🟢"
-                        status = "Strong"
-                    elif change_pct > 0:
-                        trend = "🔵"
-                        status = "Mild"
-                    elif change_pct < -0.25:
-                        trend = "🔴"
-                        status = "Weak"
-                    elif change_pct < 0:
-                        trend = "🟠"
-                        status = "Soft"
-                    else:
-                        trend = "⚪"
-                        status = "Flat"
+                    trend, status = self._FX_LABELS[bisect.bisect_right(self._FX_THRESHOLDS, change_pct)]
                     
                     analysis += f"{trend} **{pair}**: {price:.4f} ({change_pct:+.2f}%) - {status}\n"
             
             # Commodities Analysis
-            analysis += "\n🥇 **COMMODITIES & SAFE HAVENS:**\n"
-            commodities = ['Gold', 'Silver', 'Oil_WTI']
+            analysis += _COMM_HEADER
             
-            for commodity in commodities:
-                if commodity in market_data:
-                    data = market_data[commodity]
-                    price = data.get('price', 0)
-                    change_pct = data.get('change_percent', 0)
-                    
-                    if commodity == 'Gold':
-                        unit = "/oz"
-                        emoji = "🥇"
-                    elif commodity == 'Silver':
-                        unit = "/oz"
-                        emoji = "🥈"
-                    elif commodity == 'Oil_WTI':
-                        unit = "/barrel"
-                        emoji = "🛢️"
-                    else:
-                        unit = ""
-                        emoji = "📊"
+            for commodity in self._COMMODITIES:
+                if commodity in comm_quotes:
+                    price, change_pct = comm_quotes[commodity]
+                    unit, emoji = self._COMMODITY_META.get(commodity, ("", "📊"))
                     
                     trend = "📈" if change_pct > 0 else "📉" if change_pct < 0 else "➡️"
                     analysis += f"{emoji} **{commodity}**: ${price:.2f}{unit} ({change_pct:+.2f}%) {trend}\n"
             
             # DXY Analysis
-            if 'DXY' in market_data:
-                dxy_data = market_data['DXY']
-                dxy_price = dxy_data.get('price', 0)
-                dxy_change = dxy_data.get('change_percent', 0)
+            if dxy_quote is not None:
+                dxy_price, dxy_change = dxy_quote
                 
                 analysis += f"\n💵 **US DOLLAR INDEX (DXY)**: {dxy_price:.2f} ({dxy_change:+.2f}%)\n"
                 
@@ -2138,22 +2457,18 @@ class FinancialNewsAnalyzer:
                     analysis += "• USD in consolidation - mixed signals for markets\n"
             
             # Market Sentiment Analysis
-            analysis += "\n🎯 **MARKET SENTIMENT:**\n"
-            
-            # Analyze news sentiment
-            market_keywords = {
-                'bullish': ['rally', 'surge', 'climb', 'advance', 'gain', 'rise', 'jump', 'soar'],
-                'bearish': ['fall', 'drop', 'decline', 'plunge', 'tumble', 'sink', 'crash', 'sell-off'],
-                'neutral': ['stable', 'flat', 'unchanged', 'consolidate', 'range-bound']
-            }
+            analysis += _SENTIMENT_HEADER
             
+            # Analyze news sentiment with one regex scan per title and summary
             sentiment_score = 0
-            news_text = ' '.join([item.get('title', '') + ' ' + item.get('summary', '') for item in news_items]).lower()
-            
-            for word in market_keywords['bullish']:
-                sentiment_score += news_text.count(word) * 1
-            for word in market_keywords['bearish']:
-                sentiment_score += news_text.count(word) * -1
+            remaining_chars = sum(len(title) + len(summary) for title, summary in lowered_news)
+            for text in (text for pair in lowered_news for text in pair):
+                remaining_chars -= len(text)
+                for match in _SENTIMENT_RE.finditer(text):
+                    sentiment_score += _SENTIMENT_WEIGHT[match.group(1)]
+                # Stop once the unscanned text cannot pull the score back inside ±2
+                if abs(sentiment_score) - 2 > remaining_chars // _MIN_SENTIMENT_WORD_LEN:
+                    break
             
             if sentiment_score > 2:
                 sentiment = "🟢 **Bullish** - Positive market momentum"
@@ -2168,8 +2483,8 @@ class FinancialNewsAnalyzer:
             analysis += "\n🎯 **KEY TRADING INSIGHTS:**\n"
             
             # EUR/USD insights
-            if 'EUR/USD' in market_data:
-                eur_price = market_data['EUR/USD'].get('price', 0)
+            if 'EUR/USD' in fx_quotes:
+                eur_price = fx_quotes['EUR/USD'][0]
                 if eur_price > 1.09:
                     analysis += "• EUR/USD above 1.09 - watch for ECB policy divergence\n"
                 elif eur_price < 1.05:
@@ -2178,8 +2493,8 @@ class FinancialNewsAnalyzer:
                     analysis += "• EUR/USD in key range - breakout pending\n"
             
             # Gold insights
-            if 'Gold' in market_data:
-                gold_price = market_data['Gold'].get('price', 0)
+            if 'Gold' in comm_quotes:
+                gold_price = comm_quotes['Gold'][0]
                 if gold_price > 2700:
                     analysis += "• Gold at record highs - inflation hedge or safe haven bid\n"
                 elif gold_price < 2500:
@@ -2187,7 +2502,7 @@ class FinancialNewsAnalyzer:
                 else:
                     analysis += "• Gold in consolidation - watch Fed policy signals\n"
             
-            analysis += "\n💡 *Ask for 'gold prices' for detailed precious metals analysis*"
+            analysis += _ANALYSIS_FOOTER
             
             return analysis
             
@@ -2208,117 +2523,121 @@ class FinancialNewsAnalyzer:
         try:
             # Get market data and news
             market_data = self.get_market_data()
-            news_items = self.get_latest_financial_news(limit=8)
+            news_result = self.get_latest_financial_news(limit=8)
+            news_items = news_result.get('news', []) if isinstance(news_result, dict) else news_result
             
-            insights = "🎯 **ENHANCED TRADING INSIGHTS**\n\n"
+            # Lowercase titles once for all keyword detectors
+            lowered_titles = [item.get('title', '').lower() for item in news_items]
+            
+            insights = [_INSIGHTS_HEADER]
             
             # Query-specific insights
             if query.lower():
-                query_lower = query.lower()
-                if any(word in query_lower for word in ['gold', 'precious', 'metal']):
+                query_tokens = frozenset(_QUERY_TOKEN_RE.findall(query.lower()))
+                if query_tokens & self._GOLD_QUERY_WORDS:
                     # Get comprehensive gold data if available
                     gold_comprehensive = self.get_comprehensive_gold_data()
                     if gold_comprehensive.get('success'):
-                        insights += gold_comprehensive['formatted_report']
-                        return insights
+                        insights.append(gold_comprehensive['formatted_report'])
+                        return "".join(insights)
                     else:
                         # Fallback to basic gold analysis
                         if 'Gold' in market_data:
                             gold_data = market_data['Gold']
                             price = gold_data.get('price', 0)
                             change_pct = gold_data.get('change_percent', 0)
-                            insights += f"🥇 **GOLD ANALYSIS:**\n"
-                            insights += f"• Current: ${price:.2f}/oz ({change_pct:+.2f}%)\n"
-                            insights += f"• Trend: {'Bullish' if change_pct > 0 else 'Bearish' if change_pct < 0 else 'Neutral'}\n\n"
+                            insights.append(f"🥇 **GOLD ANALYSIS:**\n")
+                            insights.append(f"• Current: ${price:.2f}/oz ({change_pct:+.2f}%)\n")
+                            insights.append(f"• Trend: {'Bullish' if change_pct > 0 else 'Bearish' if change_pct < 0 else 'Neutral'}\n\n")
                 
-                elif any(word in query_lower for word in ['usd', 'dollar', 'dxy']):
+                elif query_tokens & self._USD_QUERY_WORDS:
                     if 'DXY' in market_data:
                         dxy_data = market_data['DXY']
-                        insights += f"💵 **USD ANALYSIS:**\n"
-                        insights += f"• DXY: {dxy_data.get('price', 0):.2f} ({dxy_data.get('change_percent', 0):+.2f}%)\n"
-                        insights += f"• Impact: {'USD strength pressuring commodities' if dxy_data.get('change_percent', 0) > 0 else 'USD weakness supporting risk assets'}\n\n"
+                        dxy_price = dxy_data.get('price', 0)
+                        dxy_change = dxy_data.get('change_percent', 0)
+                        insights.append(f"💵 **USD ANALYSIS:**\n")
+                        insights.append(f"• DXY: {dxy_price:.2f} ({dxy_change:+.2f}%)\n")
+                        insights.append(f"• Impact: {'USD strength pressuring commodities' if dxy_change > 0 else 'USD weakness supporting risk assets'}\n\n")
             
             # Overall market assessment
-            insights += "📊 **MARKET OVERVIEW:**\n"
+            insights.append("📊 **MARKET OVERVIEW:**\n")
             
-            # Risk sentiment
-            risk_on_pairs = ['EUR/USD', 'GBP/USD', 'AUD/USD']
+            # Single pass over market data: risk sentiment, volatility and mover candidates
+            risk_on_pairs = self._RISK_ON_PAIRS
             risk_sentiment = 0
+            high_vol_count = 0
+            gainers = []
+            losers = []
+            add_gainer = gainers.append
+            add_loser = losers.append
             
-            for pair in risk_on_pairs:
-                if pair in market_data:
-                    change = market_data[pair].get('change_percent', 0)
-                    risk_sentiment += change
+            for symbol, data in market_data.items():
+                change_pct = data.get('change_percent', 0)
+                if symbol in risk_on_pairs:
+                    risk_sentiment += change_pct
+                if abs(change_pct) > 1.0:
+                    high_vol_count += 1
+                if change_pct > 0.5:
+                    add_gainer((symbol, change_pct))
+                elif change_pct < -0.5:
+                    add_loser((symbol, change_pct))
             
             avg_risk = risk_sentiment / len(risk_on_pairs) if risk_on_pairs else 0
             
             if avg_risk > 0.2:
-                insights += "• 🟢 **Risk-On Environment** - Growth currencies outperforming\n"
+                insights.append("• 🟢 **Risk-On Environment** - Growth currencies outperforming\n")
             elif avg_risk < -0.2:
-                insights += "• 🔴 **Risk-Off Environment** - Safe havens in demand\n"
+                insights.append("• 🔴 **Risk-Off Environment** - Safe havens in demand\n")
             else:
-                insights += "• 🟡 **Mixed Sentiment** - Markets consolidating\n"
+                insights.append("• 🟡 **Mixed Sentiment** - Markets consolidating\n")
             
             # Volatility assessment
-            high_vol_count = 0
-            for symbol, data in market_data.items():
-                if abs(data.get('change_percent', 0)) > 1.0:
-                    high_vol_count += 1
-            
             vol_ratio = high_vol_count / len(market_data) if market_data else 0
             
             if vol_ratio > 0.3:
-                insights += "• ⚡ **High Volatility** - News-driven moves likely\n"
+                insights.append("• ⚡ **High Volatility** - News-driven moves likely\n")
             elif vol_ratio < 0.1:
-                insights += "• 😴 **Low Volatility** - Range-bound trading expected\n"
+                insights.append("• 😴 **Low Volatility** - Range-bound trading expected\n")
             else:
-                insights += "• 📊 **Normal Volatility** - Typical trading conditions\n"
+                insights.append("• 📊 **Normal Volatility** - Typical trading conditions\n")
             
             # Key opportunities
-            insights += "\n🎯 **TRADING OPPORTUNITIES:**\n"
+            insights.append("\n🎯 **TRADING OPPORTUNITIES:**\n")
             
-            # Find biggest movers
-            biggest_gainers = []
-            biggest_losers = []
-            
-            for symbol, data in market_data.items():
-                change_pct = data.get('change_percent', 0)
-                if change_pct > 0.5:
-                    biggest_gainers.append((symbol, change_pct))
-                elif change_pct < -0.5:
-                    biggest_losers.append((symbol, change_pct))
-            
-            biggest_gainers.sort(key=lambda x: x[1], reverse=True)
-            biggest_losers.sort(key=lambda x: x[1])
+            # Find biggest movers (only the top 3 are shown, so avoid a full sort)
+            biggest_gainers = heapq.nlargest(3, gainers, key=lambda x: x[1])
+            biggest_losers = heapq.nsmallest(3, losers, key=lambda x: x[1])
             
             if biggest_gainers:
-                insights += "📈 **Top Movers (Up):**\n"
-                for symbol, change in biggest_gainers[:3]:
-                    insights += f"• {symbol}: +{change:.2f}% - momentum play\n"
+                insights.append("📈 **Top Movers (Up):**\n")
+                for symbol, change in biggest_gainers:
+                    insights.append(f"• {symbol}: +{change:.2f}% - momentum play\n")
             
             if biggest_losers:
-                insights += "📉 **Top Movers (Down):**\n"
-                for symbol, change in biggest_losers[:3]:
-                    insights += f"• {symbol}: {change:.2f}% - potential reversal\n"
+                insights.append("📉 **Top Movers (Down):**\n")
+                for symbol, change in biggest_losers:
+                    insights.append(f"• {symbol}: {change:.2f}% - potential reversal\n")
             
             # News-based insights
             if news_items:
-                insights += "\n📰 **NEWS IMPACT:**\n"
-                fed_news = any('fed' in item.get('title', '').lower() or 'powell' in item.get('title', '').lower() for item in news_items)
-                if fed_news:
-                    insights += "• 🏛️ Fed-related news detected - watch USD and rates\n"
+                insights.append("\n📰 **NEWS IMPACT:**\n")
+                impact_topics = set()
+                for title_lower in lowered_titles:
+                    for keyword in _NEWS_IMPACT_RE.findall(title_lower):
+                        impact_topics.add(_NEWS_IMPACT_TOPICS[keyword])
                 
-                china_news = any('china' in item.get('title', '').lower() for item in news_items)
-                if china_news:
-                    insights += "• 🇨🇳 China news in focus - impacts AUD, NZD, commodities\n"
+                if 'fed' in impact_topics:
+                    insights.append("• 🏛️ Fed-related news detected - watch USD and rates\n")
                 
-                oil_news = any('oil' in item.get('title', '').lower() or 'crude' in item.get('title', '').lower() for item in news_items)
-                if oil_news:
-                    insights += "• 🛢️ Oil-related developments - affects CAD, NOK\n"
+                if 'china' in impact_topics:
+                    insights.append("• 🇨🇳 China news in focus - impacts AUD, NZD, commodities\n")
+                
+                if 'oil' in impact_topics:
+                    insights.append("• 🛢️ Oil-related developments - affects CAD, NOK\n")
             
-            insights += "\n💡 *For detailed gold analysis with karat prices, ask for 'gold prices'*"
+            insights.append(_INSIGHTS_FOOTER)
             
-            return insights
+            return "".join(insights)
             
         except Exception as e:
             logger.error(f"Error generating trading insights: {e}")
@@ -2329,8 +2648,13 @@ class FinancialNewsAnalyzer:
         Get comprehensive gold price data using the enhanced gold functions
         Returns detailed gold price information with different karats and weight units
         """
+        # Start the fallback lookup alongside the primary fetch so a failure costs one round trip, not two
+        executor = ThreadPoolExecutor(max_workers=2)
         try:
-            gold_data = fetch_all_gold_prices()
+            primary = executor.submit(fetch_all_gold_prices)
+            fallback = executor.submit(self.get_market_data, ['Gold'])
+            
+            gold_data = primary.result()
             if gold_data:
                 return {
                     'success': True,
@@ -2339,7 +2663,7 @@ class FinancialNewsAnalyzer:
                 }
             else:
                 # Fallback to basic gold data from existing methods
-                basic_data = self.get_market_data(['Gold'])
+                basic_data = fallback.result()
                 gold_basic = basic_data.get('Gold', {})
                 return {
                     'success': False,
@@ -2352,24 +2676,25 @@ class FinancialNewsAnalyzer:
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            # Don't hold the caller on an unused fallback; it finishes in the background
+            executor.shutdown(wait=False)
 
 # Test function
 def test_financial_analyzer():
-    analyzer = FinancialNewsAnalyzer()
+    analyzer = FinancialNewsAnalyzer(background_refresh=False)
     
     print("=== Testing Financial News Analyzer ===")
     
     # Test news retrieval
     print("\n1. Getting latest financial news...")
-    news = analyzer.get_latest_financial_news(limit=3)
-    for item in news:
-        print(f"- {item['title']} [{item['source']}]")
+    news = analyzer.get_latest_financial_news(limit=3).get('news', [])
+    print("\n".join(f"- {item['title']} [{item['source']}]" for item in news))
         
     # Test market data
     print("\n2. Getting market data...")
     market_data = analyzer.get_market_data(['EUR/USD', 'Gold', 'DXY'])
-    for symbol, data in market_data.items():
-        print(f"- {symbol}: {data['price']} ({data['change_percent']:+.2f}%)")
+    print("\n".join(f"- {symbol}: {data['price']} ({data['change_percent']:+.2f}%)" for symbol, data in market_data.items()))
         
     # Test trading insights
     print("\n3. Generating trading insights...")
@@ -2730,30 +3055,62 @@ def test_financial_analyzer():
             }
 
 # Enhanced Gold Price Functions
+
+# URL for Gold Futures (GC=F); only meta is read, so ask for a single daily bar
+_GOLD_URL = "https://query1.finance.yahoo.com/v8/finance/chart/GC=F?interval=1d&range=1d"
+# Using proper headers to avoid rate limiting; the JSON payload compresses well, so ask for gzip
+_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive"
+})
+
+# Shared keep-alive session so repeated gold polls reuse the TLS connection to Yahoo
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+))
+_SESSION.headers.update(_HEADERS)
+
+# Gold quotes are reused for this many seconds before Yahoo is queried again
+_GOLD_CACHE_SECONDS = 60
+
 def fetch_gold_price():
     """
     Fetch current gold price using Yahoo Finance API
     Returns price per troy ounce in USD
-    """
-    # URL for Gold Futures (GC=F)
-    url = "https://query1.finance.yahoo.com/v8/finance/chart/GC=F"
-    # Using proper headers to avoid rate limiting
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5"
-    }
     
+    Results are cached per minute so bursts of "gold prices" requests share one upstream call
+    """
+    gold_data = _fetch_gold_cached(int(time.monotonic() // _GOLD_CACHE_SECONDS))
+    if gold_data is None:
+        # Don't keep serving a failed fetch for the rest of the minute
+        _fetch_gold_cached.cache_clear()
+        return None
+    # Callers add karat fields to the dict, so hand out a copy
+    return dict(gold_data)
+
+def invalidate_gold_cache():
+    """Drop cached gold quotes so the next request hits Yahoo"""
+    _fetch_gold_cached.cache_clear()
+
+@functools.lru_cache(maxsize=4)
+def _fetch_gold_cached(bucket):
+    """Fetch the gold quote once per cache bucket (minute)"""
     try:
         # Make the request
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(_GOLD_URL, timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         
         # Extract the data
         result = data["chart"]["result"][0]
         current_price = result["meta"]["regularMarketPrice"]
-        previous_close = result["meta"]["previousClose"]
+        previous_close = result["meta"].get("previousClose") or result["meta"]["chartPreviousClose"]
         currency = result["meta"]["currency"]
         
         # Calculate changes
@@ -2769,29 +3126,41 @@ def fetch_gold_price():
             "previous_close": round(previous_close, 2),
             "change": round(price_change, 2),
             "percent_change": round(percent_change, 2),
-            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # Formatted once per cache bucket, not per request
+            "time": time.strftime("%Y-%m-%d %H:%M:%S")
         }
     except Exception as e:
         logger.error(f"Error fetching gold price: {e}")
         return None
 
+async def fetch_gold_price_async():
+    """
+    Awaitable variant of fetch_gold_price for async callers (e.g. the Telegram bot)
+    Runs the blocking request in a worker thread so it can be gathered with other fetches
+    """
+    return await asyncio.to_thread(fetch_gold_price)
+
+# Gold purity by karat
+_KARAT_PURITY = {
+    "24K": 1.000,  # 99.9% pure gold
+    "22K": 0.917,  # 91.7% pure gold
+    "18K": 0.750,  # 75.0% pure gold
+    "14K": 0.583,  # 58.3% pure gold
+    "10K": 0.417   # 41.7% pure gold
+}
+
+# 1 troy ounce = 31.1035 grams, 1 kilogram = 1000 grams
+_TROY_OZ_TO_GRAMS = 31.1035
+_GRAMS_PER_KG = 1000
+_OZ_TO_KG = _GRAMS_PER_KG / _TROY_OZ_TO_GRAMS
+# Purity and oz->kg conversion folded into one factor per karat
+_KARAT_KG_FACTORS = {karat: purity * _OZ_TO_KG for karat, purity in _KARAT_PURITY.items()}
+
 def calculate_karat_prices(pure_gold_price):
     """
     Calculate gold prices for different karat purities
     """
-    karat_purity = {
-        "24K": 1.000,  # 99.9% pure gold
-        "22K": 0.917,  # 91.7% pure gold
-        "18K": 0.750,  # 75.0% pure gold
-        "14K": 0.583,  # 58.3% pure gold
-        "10K": 0.417   # 41.7% pure gold
-    }
-    
-    karat_prices = {}
-    for karat, purity in karat_purity.items():
-        karat_prices[karat] = round(pure_gold_price * purity, 2)
-    
-    return karat_prices
+    return {karat: round(pure_gold_price * purity, 2) for karat, purity in _KARAT_PURITY.items()}
 
 def convert_troy_ounce_to_kg(price_per_oz):
     """
@@ -2799,10 +3168,7 @@ def convert_troy_ounce_to_kg(price_per_oz):
     1 troy ounce = 31.1035 grams
     1 kilogram = 1000 grams
     """
-    troy_oz_to_grams = 31.1035
-    grams_per_kg = 1000
-    price_per_kg = price_per_oz * (grams_per_kg / troy_oz_to_grams)
-    return round(price_per_kg, 2)
+    return round(price_per_oz * _OZ_TO_KG, 2)
 
 def fetch_all_gold_prices():
     """
@@ -2815,12 +3181,11 @@ def fetch_all_gold_prices():
         return None
     
     # Calculate prices for different karats
-    karat_prices = calculate_karat_prices(gold_data["price"])
+    pure_price = gold_data["price"]
+    karat_prices = calculate_karat_prices(pure_price)
     
-    # Calculate prices per kilogram for each karat
-    karat_prices_kg = {}
-    for karat, price_oz in karat_prices.items():
-        karat_prices_kg[karat] = convert_troy_ounce_to_kg(price_oz)
+    # Calculate prices per kilogram for each karat straight from the pure price
+    karat_prices_kg = {karat: round(pure_price * factor, 2) for karat, factor in _KARAT_KG_FACTORS.items()}
     
     # Add karat prices to the gold data
     gold_data["karat_prices_oz"] = karat_prices
@@ -2829,6 +3194,19 @@ def fetch_all_gold_prices():
     
     return gold_data
 
+async def fetch_all_gold_prices_async():
+    """
+    Awaitable variant of fetch_all_gold_prices without blocking the event loop
+    """
+    return await asyncio.to_thread(fetch_all_gold_prices)
+
+# Static sections of the gold price report
+_GOLD_REPORT_HEADER = "🥇 **GOLD PRICE REPORT** 🥇"
+_GOLD_CURRENT_HDR = "\n💰 **Current Gold Price (24K Pure):**"
+_GOLD_CHANGE_HDR = "\n📊 **Market Change:**"
+_KARAT_OZ_HDR = "\n🔗 **Prices by Karat (per troy ounce):**"
+_KARAT_KG_HDR = "\n🔗 **Prices by Karat (per kilogram):**"
+
 def format_gold_price_report(gold_data):
     """
     Format gold price data into a readable report
@@ -2836,28 +3214,22 @@ def format_gold_price_report(gold_data):
     if not gold_data:
         return "❌ Unable to fetch gold price data"
     
-    report = f"""🥇 **GOLD PRICE REPORT** 🥇
-📅 Last Updated: {gold_data['time']}
-
-💰 **Current Gold Price (24K Pure):**
-• ${gold_data['price']:,.2f} {gold_data['currency']} per troy ounce
-• ${gold_data['price_per_kg']:,.2f} {gold_data['currency']} per kilogram
-
-📊 **Market Change:**
-• Previous Close: ${gold_data['previous_close']:,.2f}
-• Change: ${gold_data['change']:+,.2f} ({gold_data['percent_change']:+.2f}%)
-
-🔗 **Prices by Karat (per troy ounce):**"""
-    
-    for karat, price in gold_data["karat_prices_oz"].items():
-        report += f"\n• {karat}: ${price:,.2f} {gold_data['currency']}"
-    
-    report += f"\n\n🔗 **Prices by Karat (per kilogram):**"
-    
-    for karat, price in gold_data["karat_prices_kg"].items():
-        report += f"\n• {karat}: ${price:,.2f} {gold_data['currency']}"
+    currency = gold_data['currency']
     
-    return report
+    return "\n".join([
+        _GOLD_REPORT_HEADER,
+        f"📅 Last Updated: {gold_data['time']}",
+        _GOLD_CURRENT_HDR,
+        f"• ${gold_data['price']:,.2f} {currency} per troy ounce",
+        f"• ${gold_data['price_per_kg']:,.2f} {currency} per kilogram",
+        _GOLD_CHANGE_HDR,
+        f"• Previous Close: ${gold_data['previous_close']:,.2f}",
+        f"• Change: ${gold_data['change']:+,.2f} ({gold_data['percent_change']:+.2f}%)",
+        _KARAT_OZ_HDR,
+        *(f"• {karat}: ${price:,.2f} {currency}" for karat, price in gold_data["karat_prices_oz"].items()),
+        _KARAT_KG_HDR,
+        *(f"• {karat}: ${price:,.2f} {currency}" for karat, price in gold_data["karat_prices_kg"].items())
+    ])
 
 if __name__ == "__main__":
     # Test the enhanced gold price functionality
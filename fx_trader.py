@@ -4,16 +4,125 @@ Provides daily exchange rates for XAF/USDT, XAF/AED with Yahoo Finance API for b
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
 import json
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 import logging
 import time
+import random
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 for Yahoo when httpx is available (python-telegram-bot[all] installs httpx[http2])
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 logger = logging.getLogger(__name__)
 
+# Yahoo responses worth retrying; other 4xx (bad symbol, auth) fail fast
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout) + ((httpx.TransportError,) if httpx else ())
+
+def _markup_property(multiplier):
+    """Markup percentage property that keeps its multiplier attribute in step,
+    so the refresh never recomputes it and runtime changes still apply"""
+    percentage = f"{multiplier}_percentage"
+    
+    def getter(self):
+        return getattr(self, percentage)
+    
+    def setter(self, value):
+        setattr(self, percentage, value)
+        setattr(self, multiplier, 1 + value / 100)
+    
+    return property(getter, setter)
+
 class FXTrader:
-    def __init__(self):
+    # Accepted spellings -> currency code
+    _CURRENCY_ALIASES = {
+        'USD': 'USD', 'DOLLAR': 'USD', 'DOLLARS': 'USD',
+        'USDT': 'USDT', 'TETHER': 'USDT',
+        'AED': 'AED', 'DIRHAM': 'AED', 'DIRHAMS': 'AED',
+        'CNY': 'CNY', 'RMB': 'CNY', 'YUAN': 'CNY',
+        'EUR': 'EUR', 'EURO': 'EUR', 'EUROS': 'EUR',
+        'XAF': 'XAF', 'XOF': 'XOF',
+    }
+    _LOCAL_CURRENCIES = ('XAF', 'XOF')
+    # Default lifetime of a cached provider response (Yahoo quote or exchangerate-api table)
+    _TTL_SECONDS = 300
+    # Per-pair quote lifetimes; the thinly traded XAF/XOF pairs are refetched
+    # more often than the stable AED/CNY/EUR crosses
+    _TTL_BY_RATE = {
+        'USD_XAF': 600,
+        'USD_XOF': 600,
+        'AED_USD': 1800,
+        'USD_CNY': 1800,
+        'USD_EUR': 1800,
+    }
+    # Market rate -> (Yahoo symbol, fallback base, fallback quote, last-resort default)
+    _FX_SPECS = {
+        'USD_XAF': ('USDXAF=X', 'USD', 'XAF', 558.0),
+        'AED_USD': ('AEDUSD=X', 'AED', 'USD', 0.272),
+        'USD_XOF': ('USDXOF=X', 'USD', 'XOF', 558.0),
+        'USD_CNY': ('USDCNY=X', 'USD', 'CNY', 7.14),
+        'USD_EUR': ('USDEUR=X', 'USD', 'EUR', 0.858),
+    }
+    _GREETING = """👋 **Hello! Welcome to EVA Fx Trading Service**
+
+🤖 **AI DISCLAIMER:** This is an AI-powered trading assistant. All rates and information are automatically generated and should be verified before making any financial decisions.
+
+"""
+    # Foreign currency -> footer line of its calculate_exchange reply
+    _CURRENCY_TAGLINES = {
+        'USD': '*Service fee included*',
+        'USDT': '*Service fee included*',
+        'AED': '*Service fee included*',
+        'CNY': '*Premium China market rates*',
+        'EUR': '*Premium European market rates*',
+    }
+    # Listed in the unsupported-currency reply
+    _SUPPORTED_LIST = ', '.join([*_CURRENCY_TAGLINES, *_LOCAL_CURRENCIES])
+    _SUPPORTED_CURRENCIES = frozenset([*_CURRENCY_TAGLINES, *_LOCAL_CURRENCIES])
+    
+    # Markup percentages, each backed by its precomputed multiplier
+    usd_markup_percentage = _markup_property('_m_usd')
+    usdt_markup_percentage = _markup_property('_m_usdt')
+    aed_markup_percentage = _markup_property('_m_aed')
+    xof_markup_percentage = _markup_property('_m_xof')
+    xaf_cny_markup_percentage = _markup_property('_m_xaf_cny')
+    xof_cny_markup_percentage = _markup_property('_m_xof_cny')
+    xaf_eur_markup_percentage = _markup_property('_m_xaf_eur')
+    xof_eur_markup_percentage = _markup_property('_m_xof_eur')
+    
+    # Selling rate (local_foreign) -> markup multiplier attribute applied to its cross rate
+    _SELLING_MARKUPS = {
+        'XAF_USD': '_m_usd',
+        'XAF_USDT': '_m_usdt',
+        'XAF_AED': '_m_aed',
+        'XAF_CNY': '_m_xaf_cny',
+        'XAF_EUR': '_m_xaf_eur',
+        'XOF_USD': '_m_xof',
+        'XOF_USDT': '_m_xof',
+        'XOF_AED': '_m_xof',
+        'XOF_CNY': '_m_xof_cny',
+        'XOF_EUR': '_m_xof_eur',
+    }
+    
+    def __init__(self, background_refresh=True):
+        # Never mutated in place: each refresh builds a complete new dict and
+        # swaps it in, so readers on other threads see one consistent snapshot
         self.base_rates = {
             'XAF_USD': 0.0,
             'XAF_USDT': 0.0,
@@ -30,26 +139,253 @@ class FXTrader:
         self.usd_markup_percentage = 9  # 9% markup on USD rates
         self.usdt_markup_percentage = 8.5 # 8.5% markup on USDT rates
         self.aed_markup_percentage = 8.5  # 8.5% markup on AED rates
-        self.xof_markup_percentage = 4  # 3.5% markup on XOF rates
+        self.xof_markup_percentage = 4  # 4% markup on XOF rates (USD, USDT and AED)
         # New currency markups
         self.xaf_cny_markup_percentage = 9.5  # 9.5% markup on XAF/CNY rates
         self.xof_cny_markup_percentage = 5.0  # 5% markup on XOF/CNY rates
-        self.xaf_eur_markup_percentage = 9.0  # 6% markup on XAF/EUR rates
+        self.xaf_eur_markup_percentage = 9.0  # 9% markup on XAF/EUR rates
         self.xof_eur_markup_percentage = 4.0  # 4% markup on XOF/EUR rates
+        self._tz = ZoneInfo('Africa/Douala')
         # Yahoo Finance API endpoints
         self.yahoo_finance_url = "https://query1.finance.yahoo.com/v8/finance/chart"
+        self.yahoo_spark_url = "https://query1.finance.yahoo.com/v8/finance/spark"
+        # Pooled keep-alive connections to both rate providers. Yahoo retries
+        # live in _yahoo_get (they feed the circuit breaker); exchangerate-api
+        # retries transient errors at the adapter level
+        self.session = requests.Session()
+        self.session.mount('https://query1.finance.yahoo.com', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        self.session.mount('https://api.exchangerate-api.com', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        ))
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        # (connect, read) seconds; Yahoo answers in well under a second
+        self._http_timeout = (2.0, 3.0)
+        # Yahoo requests (the batch and concurrent per-symbol fallbacks) share
+        # one multiplexed HTTP/2 connection; None means use the requests session
+        self._yahoo_client = None
+        if httpx is not None:
+            try:
+                self._yahoo_client = httpx.Client(
+                    http2=True,
+                    timeout=httpx.Timeout(self._http_timeout[1], connect=self._http_timeout[0]),
+                    headers={'User-Agent': self.session.headers['User-Agent']}
+                )
+            except ImportError:
+                # httpx without the h2 extra
+                pass
+        # FX rates move on a minutes scale: rates younger than the hard TTL
+        # are served as-is, up to the soft TTL they are served (tagged as
+        # cached) while a background refresh runs, beyond that callers wait
+        self._rates_cached_at = 0.0
+        # Deadline (monotonic) until which base_rates count as fresh; 0 = never refreshed
+        self._rates_fresh_until = 0.0
+        # Monotonic deadline of the Douala day the rates were fetched on; the
+        # daily message is never served, even stale, past that midnight
+        self._rates_day_ends = 0.0
+        # _FX_SPECS keys the last refresh had to fill from old or default rates
+        self._rates_stale_pairs = []
+        self._rates_hard_ttl = 300
+        self._rates_soft_ttl = 3600
+        self._rates_stamp = ''
+        # (base_rates snapshot, daily message rendered from it)
+        self._daily_rates_cache = (None, '')
+        # calculate_exchange replies for one base_rates snapshot:
+        # (snapshot, {(amount, currency): reply}); a new snapshot starts afresh
+        self._exchange_replies = (None, {})
+        self._exchange_replies_max = 64
+        self._refresh_lock = threading.Lock()
+        # Guards publishing base_rates with their deadlines against the
+        # "(cached)" tagging of stale rates
+        self._rates_lock = threading.Lock()
+        # Provider responses: key -> (value, expires_at on the monotonic clock)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_key_locks = {}
+        # Cache lifetimes from _TTL_BY_RATE, by Yahoo symbol and by fallback
+        # base; a fallback table serves several pairs, so it gets the shortest
+        self._yahoo_ttls = {}
+        self._fallback_ttls = {}
+        for key, (symbol, base, _, _) in self._FX_SPECS.items():
+            ttl = self._TTL_BY_RATE.get(key, self._TTL_SECONDS)
+            self._yahoo_ttls[symbol] = ttl
+            self._fallback_ttls[base] = min(ttl, self._fallback_ttls.get(base, ttl))
+        # Last market rate actually fetched per _FX_SPECS key (no markup)
+        self._last_good_rates = {}
+        # Last good rates on disk (next to this module unless FX_RATES_CACHE_FILE
+        # says otherwise) so restarts start warm; set FX_RATES_CACHE_FILE='' to disable
+        self._disk_cache_path = os.getenv(
+            'FX_RATES_CACHE_FILE',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fx_rates_cache.json')
+        )
+        self._load_rates_from_disk()
+        # Circuit breaker: after 5 straight Yahoo failures skip Yahoo for 60s
+        self._yahoo_failures = 0
+        self._yahoo_open_until = 0.0
+        self._yahoo_fail_max = 5
+        self._yahoo_reset_timeout = 60
+        # Token bucket shared by all outbound provider requests: bursts of
+        # _request_burst, then _request_rate per second, so a cold-cache
+        # fan-out plus retries can't get us throttled upstream
+        self._request_rate = 2.0
+        self._request_burst = 5
+        self._request_tokens = float(self._request_burst)
+        self._request_tokens_at = time.monotonic()
+        self._request_lock = threading.Lock()
+        
+        # Background refresher (see start()): keeps rates inside the hard TTL
+        # so message handlers read base_rates without touching the network
+        self._refresh_interval = max(self._rates_hard_ttl - 30, 30)
+        self._refresh_retry_interval = 30
+        self._stop_refresh = threading.Event()
+        self._refresh_thread = None
+        self._start_lock = threading.Lock()
+        if background_refresh:
+            self.start()
+    
+    def start(self):
+        """Start the background refresh thread; later calls are no-ops"""
+        with self._start_lock:
+            if self._refresh_thread is not None:
+                return
+            self._refresh_thread = threading.Thread(target=self._refresh_loop, name="fx-rates-refresh-loop", daemon=True)
+            self._refresh_thread.start()
+    
+    def _refresh_loop(self):
+        """Refresh rates now and then every _refresh_interval seconds until close().
+        
+        A failed or partly stale refresh is retried after _refresh_retry_interval
+        instead, so the cache is re-primed soon after a provider hiccup.
+        """
+        while True:
+            refreshed = False
+            try:
+                with self._refresh_lock:
+                    refreshed = self._refresh_rates()
+            except Exception as e:
+                logger.warning(f"Background FX rate refresh failed: {e}")
+            interval = self._refresh_interval if refreshed and not self._rates_stale_pairs else self._refresh_retry_interval
+            if self._stop_refresh.wait(interval):
+                break
+    
+    def close(self):
+        """Stop the background refresh thread and release pooled HTTP connections"""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+        self.session.close()
+        if self._yahoo_client is not None:
+            self._yahoo_client.close()
+    
+    def _yahoo_get(self, url, attempts=3, initial_backoff=0.2, max_backoff=2.0):
+        """GET a Yahoo URL, retrying 429/5xx and network errors with jittered backoff.
+        
+        Returns None without a request while the circuit breaker is open.
+        """
+        if time.monotonic() < self._yahoo_open_until:
+            logger.debug("Yahoo Finance circuit open, skipping request")
+            return None
+        try:
+            response = self._yahoo_get_with_retries(url, attempts, initial_backoff, max_backoff)
+        except Exception:
+            self._record_yahoo_result(False)
+            raise
+        self._record_yahoo_result(response.status_code == 200)
+        return response
+    
+    def _yahoo_get_with_retries(self, url, attempts, initial_backoff, max_backoff):
+        for attempt in range(1, attempts + 1):
+            self._throttle()
+            try:
+                if self._yahoo_client is not None:
+                    response = self._yahoo_client.get(url)
+                else:
+                    response = self.session.get(url, timeout=self._http_timeout)
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == attempts:
+                    return response
+                logger.debug(f"Yahoo Finance returned {response.status_code}, retry {attempt}/{attempts - 1}")
+            except TRANSIENT_ERRORS as e:
+                if attempt == attempts:
+                    raise
+                logger.debug(f"Yahoo Finance request failed ({e}), retry {attempt}/{attempts - 1}")
+            time.sleep(random.uniform(0, min(max_backoff, initial_backoff * 2 ** attempt)))
+    
+    def _throttle(self):
+        """Block until the outbound request token bucket has a token"""
+        while True:
+            with self._request_lock:
+                now = time.monotonic()
+                self._request_tokens = min(
+                    self._request_burst,
+                    self._request_tokens + (now - self._request_tokens_at) * self._request_rate
+                )
+                self._request_tokens_at = now
+                if self._request_tokens >= 1:
+                    self._request_tokens -= 1
+                    return
+                wait = (1 - self._request_tokens) / self._request_rate
+            time.sleep(wait)
+    
+    def _record_yahoo_result(self, success):
+        """Update the Yahoo circuit breaker after a request"""
+        if success:
+            self._yahoo_failures = 0
+            return
+        self._yahoo_failures += 1
+        if self._yahoo_failures >= self._yahoo_fail_max:
+            self._yahoo_open_until = time.monotonic() + self._yahoo_reset_timeout
+            self._yahoo_failures = 0
+            logger.warning(f"Yahoo Finance circuit open for {self._yahoo_reset_timeout}s")
+    
+    def _cached(self, key, ttl, fetch_fn):
+        """Return fetch_fn() memoized under key for ttl seconds; failed (empty) fetches aren't cached.
+        
+        Concurrent misses on the same key share one fetch, so e.g. the four
+        USD pairs falling back together make a single exchangerate-api call.
+        """
+        value = self._cache_get(key)
+        if value is not None:
+            return value
+        with self._cache_lock:
+            key_lock = self._cache_key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self._cache_get(key)
+            if value is not None:
+                return value
+            value = fetch_fn()
+            if value:
+                self._cache_put(key, value, ttl)
+            return value
+    
+    def _cache_get(self, key):
+        """Cached value for key, or None if missing or expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() < entry[1]:
+                return entry[0]
+        return None
+    
+    def _cache_put(self, key, value, ttl):
+        with self._cache_lock:
+            self._cache[key] = (value, time.monotonic() + ttl)
     
     def get_yahoo_rate(self, symbol):
-        """Get exchange rate from Yahoo Finance API"""
+        """Get exchange rate from Yahoo Finance API (cached for its pair's TTL)"""
+        ttl = self._yahoo_ttls.get(symbol, self._TTL_SECONDS)
+        return self._cached(('yahoo', symbol), ttl, lambda: self._fetch_yahoo_rate(symbol))
+    
+    def _fetch_yahoo_rate(self, symbol):
         try:
             url = f"{self.yahoo_finance_url}/{symbol}?interval=1d&range=1d"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._yahoo_get(url)
+            if response is None:
+                return None
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 # Extract current price from Yahoo Finance response
                 result = data.get('chart', {}).get('result', [])
                 if result and len(result) > 0:
@@ -66,13 +402,54 @@ class FXTrader:
             logger.error(f"Error fetching Yahoo Finance rate for {symbol}: {e}")
             return None
     
+    def get_yahoo_rates_batch(self, symbols):
+        """Get several exchange rates from Yahoo Finance in a single request"""
+        try:
+            url = f"{self.yahoo_spark_url}?symbols={','.join(symbols)}&range=1d&interval=1d&indicators=close"
+            response = self._yahoo_get(url)
+            if response is None:
+                return {}
+            
+            if response.status_code != 200:
+                logger.warning(f"Yahoo Finance batch failed, status: {response.status_code}")
+                return {}
+            
+            data = _json_loads(response.content)
+            rates = {}
+            # The spark endpoint answers either {symbol: {close: [...]}} or the
+            # chart-style {spark: {result: [{symbol, response: [{meta}]}]}}
+            if 'spark' in data:
+                for item in data['spark'].get('result') or []:
+                    chart = (item.get('response') or [{}])[0]
+                    meta = chart.get('meta', {})
+                    price = meta.get('regularMarketPrice') or meta.get('previousClose')
+                    if price:
+                        rates[item.get('symbol')] = float(price)
+            else:
+                for symbol in symbols:
+                    closes = [c for c in (data.get(symbol) or {}).get('close') or [] if c]
+                    if closes:
+                        rates[symbol] = float(closes[-1])
+            
+            logger.info(f"Yahoo Finance batch rates: {rates}")
+            return rates
+            
+        except Exception as e:
+            logger.error(f"Error fetching Yahoo Finance batch rates: {e}")
+            return {}
+    
     def get_fallback_rate(self, base_currency):
-        """Fallback to exchangerate-api if Yahoo Finance fails"""
+        """Fallback to exchangerate-api if Yahoo Finance fails (cached for its pairs' shortest TTL)"""
+        ttl = self._fallback_ttls.get(base_currency, self._TTL_SECONDS)
+        return self._cached(('fallback', base_currency), ttl, lambda: self._fetch_fallback_rates(base_currency))
+    
+    def _fetch_fallback_rates(self, base_currency):
         try:
             url = f"https://api.exchangerate-api.com/v4/latest/{base_currency}"
-            response = requests.get(url, timeout=10)
+            self._throttle()
+            response = self.session.get(url, timeout=self._http_timeout)
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get('rates', {})
             return None
         except Exception as e:
@@ -81,233 +458,248 @@ class FXTrader:
     
     def get_greeting_and_disclaimer(self):
         """Get greeting and AI disclaimer for messages"""
-        return """👋 **Hello! Welcome to EVA Fx Trading Service**
-
-🤖 **AI DISCLAIMER:** This is an AI-powered trading assistant. All rates and information are automatically generated and should be verified before making any financial decisions.
-
-"""
+        return self._GREETING
     
-    def get_usd_xaf_rate(self):
-        """Get USD/XAF rate from Yahoo Finance with fallback"""
+    def _get_rate(self, key):
+        """Get one _FX_SPECS rate from Yahoo Finance, then exchangerate-api; None if both fail"""
+        symbol, base, quote, _ = self._FX_SPECS[key]
         try:
             # Try Yahoo Finance first
-            rate = self.get_yahoo_rate("USDXAF=X")
+            rate = self.get_yahoo_rate(symbol)
             if rate:
+                self._last_good_rates[key] = rate
                 return rate
             
             # Fallback to exchange rate API
-            fallback_data = self.get_fallback_rate("USD")
-            if fallback_data and 'XAF' in fallback_data:
-                rate = fallback_data['XAF']
-                logger.info(f"Fallback USD/XAF rate: {rate}")
+            fallback_data = self.get_fallback_rate(base)
+            if fallback_data and quote in fallback_data:
+                rate = fallback_data[quote]
+                logger.info(f"Fallback {base}/{quote} rate: {rate}")
+                self._last_good_rates[key] = rate
                 return rate
             
-            logger.error("All USD/XAF rate sources failed")
-            return 558.0  # Use your observed rate as final fallback
+            logger.error(f"All {base}/{quote} rate sources failed")
             
         except Exception as e:
-            logger.error(f"Error fetching USD/XAF rate: {e}")
-            return 558.0
+            logger.error(f"Error fetching {base}/{quote} rate: {e}")
+        return None
     
-    def get_aed_usd_rate(self):
-        """Get AED/USD rate from Yahoo Finance with fallback"""
+    def _save_rates_to_disk(self):
+        """Persist the last good rates so a restarted process can serve them immediately"""
+        if not self._disk_cache_path:
+            return
         try:
-            # Try Yahoo Finance first
-            rate = self.get_yahoo_rate("AEDUSD=X")
-            if rate:
-                return rate
-            
-            # Fallback to exchange rate API
-            fallback_data = self.get_fallback_rate("AED")
-            if fallback_data and 'USD' in fallback_data:
-                rate = fallback_data['USD']
-                logger.info(f"Fallback AED/USD rate: {rate}")
-                return rate
-                
-            # Final fallback - approximate rate
-            return 0.272  # Approximate current rate as fallback
-            
+            tmp_path = f"{self._disk_cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'base_rates': self.base_rates,
+                    'market_rates': self._last_good_rates,
+                    'stamp': self._rates_stamp,
+                    'saved_at': time.time()
+                }, f)
+            os.replace(tmp_path, self._disk_cache_path)
         except Exception as e:
-            logger.error(f"Error fetching AED/USD rate: {e}")
-            return 0.272
+            logger.warning(f"Could not save FX rates cache: {e}")
     
-    def get_usd_xof_rate(self):
-        """Get USD/XOF rate from Yahoo Finance with fallback"""
+    def _load_rates_from_disk(self):
+        """Restore rates saved by a previous process if they are still within the soft TTL"""
+        if not self._disk_cache_path or not os.path.exists(self._disk_cache_path):
+            return
         try:
-            # Try Yahoo Finance first
-            rate = self.get_yahoo_rate("USDXOF=X")
-            if rate:
-                return rate
-            
-            # Fallback to exchange rate API
-            fallback_data = self.get_fallback_rate("USD")
-            if fallback_data and 'XOF' in fallback_data:
-                rate = fallback_data['XOF']
-                logger.info(f"Fallback USD/XOF rate: {rate}")
-                return rate
-                
-            # XOF typically close to XAF, use a similar rate
-            return 558.0  # Approximate rate as fallback
-            
+            with open(self._disk_cache_path) as f:
+                saved = json.load(f)
+            # Last known market rates stay useful as a fallback however old the snapshot
+            self._last_good_rates.update(saved.get('market_rates', {}))
+            age = time.time() - saved['saved_at']
+            if not 0 <= age < self._rates_soft_ttl:
+                return
+            self.base_rates = {**self.base_rates, **saved['base_rates']}
+            self._rates_stamp = saved['stamp']
+            # Re-express the wall-clock age on the monotonic clock the TTLs use
+            self._set_rates_deadlines(time.monotonic() - age, saved['saved_at'])
+            logger.info(f"Loaded FX rates cached {age:.0f}s ago")
         except Exception as e:
-            logger.error(f"Error fetching USD/XOF rate: {e}")
-            return 558.0
+            logger.warning(f"Could not load FX rates cache: {e}")
     
-    def get_usd_cny_rate(self):
-        """Get USD/CNY rate from Yahoo Finance with fallback"""
-        try:
-            # Try Yahoo Finance first
-            rate = self.get_yahoo_rate("USDCNY=X")
-            if rate:
-                return rate
-            
-            # Fallback to exchange rate API
-            fallback_data = self.get_fallback_rate("USD")
-            if fallback_data and 'CNY' in fallback_data:
-                rate = fallback_data['CNY']
-                logger.info(f"Fallback USD/CNY rate: {rate}")
-                return rate
-                
-            # Final fallback - approximate rate
-            return 7.14  # Approximate current rate as fallback
-            
-        except Exception as e:
-            logger.error(f"Error fetching USD/CNY rate: {e}")
-            return 7.14
+    def _set_rates_deadlines(self, cached_at, fetched_at):
+        """Record rates fetched at monotonic cached_at / wall-clock fetched_at;
+        they stay fresh for the hard TTL but never past Douala midnight"""
+        fetched = datetime.fromtimestamp(fetched_at, self._tz)
+        midnight = datetime.combine(fetched.date() + timedelta(days=1), datetime.min.time(), fetched.tzinfo)
+        self._rates_cached_at = cached_at
+        self._rates_day_ends = cached_at + (midnight - fetched).total_seconds()
+        self._rates_fresh_until = min(cached_at + self._rates_hard_ttl, self._rates_day_ends)
     
-    def get_usd_eur_rate(self):
-        """Get USD/EUR rate from Yahoo Finance with fallback"""
-        try:
-            # Try Yahoo Finance first
-            rate = self.get_yahoo_rate("USDEUR=X")
-            if rate:
-                return rate
-            
-            # Fallback to exchange rate API
-            fallback_data = self.get_fallback_rate("USD")
-            if fallback_data and 'EUR' in fallback_data:
-                rate = fallback_data['EUR']
-                logger.info(f"Fallback USD/EUR rate: {rate}")
-                return rate
-                
-            # Final fallback - approximate rate
-            return 0.858  # Approximate current rate as fallback
-            
-        except Exception as e:
-            logger.error(f"Error fetching USD/EUR rate: {e}")
-            return 0.858
+    def _rates_fresh(self):
+        """True while the last successful calculate_rates is within the hard TTL"""
+        return time.monotonic() < self._rates_fresh_until
+    
+    @property
+    def rates_ready(self):
+        """True while base_rates can be read as-is; calculate_rates() would not fetch"""
+        return self._rates_fresh()
+    
+    def calculate_rates(self, force_refresh=False):
+        """Calculate all FX rates with markup
+        
+        force_refresh=True skips every cache layer and refetches from the providers.
+        """
+        if force_refresh:
+            with self._cache_lock:
+                self._cache.clear()
+            with self._refresh_lock:
+                return self._refresh_rates()
+        if self._rates_fresh():
+            return True
+        now = time.monotonic()
+        if self._rates_stamp and now - self._rates_cached_at < self._rates_soft_ttl and now < self._rates_day_ends:
+            # Stale but usable: answer now, revalidate off the request path
+            self._tag_rates_cached()
+            self._refresh_in_background()
+            return True
+        # Single flight: callers arriving mid-refresh wait for it and reuse
+        # the result instead of starting their own fan-out
+        with self._refresh_lock:
+            if self._rates_fresh():
+                return True
+            return self._refresh_rates()
+    
+    def _tag_rates_cached(self):
+        """Swap in a copy of base_rates tagged "(cached)" while they are still stale
+        
+        Rates already tagged (cached or approximate) keep their tag.
+        """
+        with self._rates_lock:
+            rates = self.base_rates
+            if not self._rates_fresh() and rates['last_updated'] == self._rates_stamp:
+                self.base_rates = {**rates, 'last_updated': f"{self._rates_stamp} (cached)"}
     
-    def calculate_rates(self):
-        """Calculate all FX rates with markup"""
+    def _refresh_in_background(self):
+        """Start a refresh thread unless a refresh is already running"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        
+        def run():
+            try:
+                self._refresh_rates()
+            finally:
+                self._refresh_lock.release()
+        
+        threading.Thread(target=run, name='fx-rates-refresh', daemon=True).start()
+    
+    def _refresh_rates(self):
+        """Fetch market rates and rebuild base_rates"""
         try:
-            # Get base USD/XAF rate
-            usd_xaf_rate = self.get_usd_xaf_rate()
-            if not usd_xaf_rate:
-                logger.error("Could not fetch USD/XAF rate")
-                return False
-            
-            # Get AED/USD rate
-            aed_usd_rate = self.get_aed_usd_rate()
-            if not aed_usd_rate:
-                logger.error("Could not fetch AED/USD rate")
-                return False
-            
-            # Get USD/XOF rate
-            usd_xof_rate = self.get_usd_xof_rate()
-            if not usd_xof_rate:
-                logger.error("Could not fetch USD/XOF rate")
-                return False
-            
-            # Get USD/CNY rate
-            usd_cny_rate = self.get_usd_cny_rate()
-            if not usd_cny_rate:
-                logger.error("Could not fetch USD/CNY rate")
-                return False
-            
-            # Get USD/EUR rate
-            usd_eur_rate = self.get_usd_eur_rate()
-            if not usd_eur_rate:
-                logger.error("Could not fetch USD/EUR rate")
-                return False
-            
-            # Calculate rates with different markups
-            usd_markup_multiplier = 1 + (self.usd_markup_percentage / 100)
-            usdt_markup_multiplier = 1 + (self.usdt_markup_percentage / 100)
-            aed_markup_multiplier = 1 + (self.aed_markup_percentage / 100)
-            xof_markup_multiplier = 1 + (self.xof_markup_percentage / 100)
-            # New currency markup multipliers
-            xaf_cny_markup_multiplier = 1 + (self.xaf_cny_markup_percentage / 100)
-            xof_cny_markup_multiplier = 1 + (self.xof_cny_markup_percentage / 100)
-            xaf_eur_markup_multiplier = 1 + (self.xaf_eur_markup_percentage / 100)
-            xof_eur_markup_multiplier = 1 + (self.xof_eur_markup_percentage / 100)
-            
-            # XAF/USD with 9% markup (how much XAF to buy 1 USD from us)
-            calculated_usd_rate = round(usd_xaf_rate * usd_markup_multiplier, 2)
-            self.base_rates['XAF_USD'] = calculated_usd_rate  # No minimum floor limit
-            
-            # XAF/USDT with 8.5% markup 
-            calculated_usdt_rate = round(usd_xaf_rate * usdt_markup_multiplier, 2)
-            self.base_rates['XAF_USDT'] = calculated_usdt_rate  # No minimum floor limit
-            
-            # XAF/AED with 8.5% markup
-            # First convert: AED -> USD -> XAF, then add markup
-            aed_xaf_rate = aed_usd_rate * usd_xaf_rate
-            self.base_rates['XAF_AED'] = round(aed_xaf_rate * aed_markup_multiplier, 2)
-            
-            # XOF rates with 3.5% markup (unchanged)
-            self.base_rates['XOF_USD'] = round(usd_xof_rate * xof_markup_multiplier, 2)  # 3.5% for USD
-            self.base_rates['XOF_USDT'] = round(usd_xof_rate * xof_markup_multiplier, 2)  # 3.5% for USDT
-            # XOF/AED: AED -> USD -> XOF, then add markup
-            aed_xof_rate = aed_usd_rate * usd_xof_rate
-            self.base_rates['XOF_AED'] = round(aed_xof_rate * xof_markup_multiplier, 2)
-            
-            # New currency pairs
-            # XAF/CNY with 9.5% markup: CNY -> USD -> XAF
-            cny_xaf_rate = (1 / usd_cny_rate) * usd_xaf_rate  # Convert CNY to USD to XAF
-            self.base_rates['XAF_CNY'] = round(cny_xaf_rate * xaf_cny_markup_multiplier, 2)
-            
-            # XOF/CNY with 5% markup: CNY -> USD -> XOF
-            cny_xof_rate = (1 / usd_cny_rate) * usd_xof_rate  # Convert CNY to USD to XOF
-            self.base_rates['XOF_CNY'] = round(cny_xof_rate * xof_cny_markup_multiplier, 2)
-            
-            # XAF/EUR with 6% markup: EUR -> USD -> XAF
-            eur_xaf_rate = (1 / usd_eur_rate) * usd_xaf_rate  # Convert EUR to USD to XAF
-            self.base_rates['XAF_EUR'] = round(eur_xaf_rate * xaf_eur_markup_multiplier, 2)
+            # Quotes still within their pair's TTL are reused; the rest come
+            # from one Yahoo round-trip. A pair missing from the batch goes
+            # through _get_rate and its fallbacks instead
+            rates = {key: self._cache_get(('yahoo', spec[0])) for key, spec in self._FX_SPECS.items()}
+            expired = [spec[0] for key, spec in self._FX_SPECS.items() if not rates[key]]
+            if expired:
+                batch = self.get_yahoo_rates_batch(expired)
+                for key, (symbol, _, _, _) in self._FX_SPECS.items():
+                    if not rates[key] and batch.get(symbol):
+                        rates[key] = batch[symbol]
+                        self._cache_put(('yahoo', symbol), rates[key], self._yahoo_ttls[symbol])
+            self._last_good_rates.update((key, rate) for key, rate in rates.items() if rate)
+            missing = [key for key, rate in rates.items() if not rate]
+            if missing:
+                # Fallback lookups are independent, so run them side by side
+                with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                    for key, rate in zip(missing, executor.map(self._get_rate, missing)):
+                        rates[key] = rate
+            # Stale-while-error: a pair no source answered reuses the last rate
+            # actually fetched and the rates are tagged "(cached)"; a pair never
+            # fetched falls back to its hard-coded default, tagged "(approximate)"
+            stale = [key for key, rate in rates.items() if not rate]
+            approximate = False
+            for key in stale:
+                rates[key] = self._last_good_rates.get(key)
+                if rates[key]:
+                    logger.warning(f"Could not fetch {key} rate, using last known {rates[key]}")
+                else:
+                    rates[key] = self._FX_SPECS[key][3]
+                    approximate = True
+                    logger.warning(f"Could not fetch {key} rate and none fetched before, using approximate default {rates[key]}")
+            
+            # Local currency per USD, and USD per unit of each foreign currency;
+            # CNY and EUR are quoted per USD, so their reciprocals are taken once
+            local_per_usd = {'XAF': rates['USD_XAF'], 'XOF': rates['USD_XOF']}
+            usd_per_unit = {
+                'USD': 1.0,
+                'USDT': 1.0,
+                'AED': rates['AED_USD'],
+                'CNY': 1 / rates['USD_CNY'],
+                'EUR': 1 / rates['USD_EUR'],
+            }
             
-            # XOF/EUR with 4% markup: EUR -> USD -> XOF
-            eur_xof_rate = (1 / usd_eur_rate) * usd_xof_rate  # Convert EUR to USD to XOF
-            self.base_rates['XOF_EUR'] = round(eur_xof_rate * xof_eur_markup_multiplier, 2)
+            # Selling rate = cross rate (XAF/XOF per unit of the currency) x
+            # pair markup; no minimum floor
+            new_rates = {}
+            for key, multiplier in self._SELLING_MARKUPS.items():
+                local, foreign = key.split('_')
+                new_rates[key] = round(usd_per_unit[foreign] * local_per_usd[local] * getattr(self, multiplier), 2)
             
             # Update timestamp
-            cameroon_tz = pytz.timezone('Africa/Douala')
-            self.base_rates['last_updated'] = datetime.now(cameroon_tz).strftime('%Y-%m-%d %H:%M:%S %Z')
-            
-            logger.info(f"Updated FX rates: {self.base_rates}")
+            self._rates_stamp = datetime.now(self._tz).strftime('%Y-%m-%d %H:%M:%S %Z')
+            if approximate:
+                new_rates['last_updated'] = f"{self._rates_stamp} (approximate)"
+            else:
+                new_rates['last_updated'] = f"{self._rates_stamp} (cached)" if stale else self._rates_stamp
+            # Publish the complete set in one assignment, together with its deadlines
+            with self._rates_lock:
+                self.base_rates = new_rates
+                self._set_rates_deadlines(time.monotonic(), time.time())
+                self._rates_stale_pairs = stale
+                if stale:
+                    # Try the providers again soon rather than a full TTL later
+                    self._rates_fresh_until = min(self._rates_fresh_until, self._rates_cached_at + self._refresh_retry_interval)
+            self._daily_rates_cache = (new_rates, self._render_daily_rates(new_rates))
+            # Rates patched from old or default values must not come back as
+            # fresh after a restart
+            if not stale:
+                self._save_rates_to_disk()
+            logger.info(f"Updated FX rates: {new_rates}")
             return True
             
         except Exception as e:
             logger.error(f"Error calculating FX rates: {e}")
             return False
     
+    async def calculate_rates_async(self):
+        """Non-blocking calculate_rates for async callers"""
+        return await asyncio.to_thread(self.calculate_rates)
+    
     def get_daily_rates(self):
         """Get daily FX rates summary"""
-        if not self.calculate_rates():
+        if not self._rates_fresh() and not self.calculate_rates():
             return "⚠️ Unable to fetch current exchange rates. Please try again later."
         
-        greeting = self.get_greeting_and_disclaimer()
+        # Rendered once per base_rates snapshot; a refresh or a "(cached)"
+        # tag swaps in a new dict and so a new message
+        rates = self.base_rates
+        cached_rates, message = self._daily_rates_cache
+        if cached_rates is not rates:
+            message = self._render_daily_rates(rates)
+            self._daily_rates_cache = (rates, message)
+        return message
+    
+    def _render_daily_rates(self, rates):
+        """Build the daily rates message from a base_rates snapshot"""
+        greeting = self._GREETING
+        rate_lines = '\n'.join(
+            f"• 1 {code} = {rates[f'XAF_{code}']:,} XAF | {rates[f'XOF_{code}']:,} XOF"
+            for code in self._CURRENCY_TAGLINES
+        )
         
         rates_message = f"""
 {greeting}🏦 **EVA FX TRADING RATES** 📈
 💼 *EVA Fx - Premium Currency Exchange*
 
-📅 **{self.base_rates['last_updated']}**
+📅 **{rates['last_updated']}**
 
 💱 **TODAY'S SELLING RATES:**
-• 1 USD = {self.base_rates['XAF_USD']:,} XAF | {self.base_rates['XOF_USD']:,} XOF
-• 1 USDT = {self.base_rates['XAF_USDT']:,} XAF | {self.base_rates['XOF_USDT']:,} XOF
-• 1 AED = {self.base_rates['XAF_AED']:,} XAF | {self.base_rates['XOF_AED']:,} XOF
-• 1 CNY = {self.base_rates['XAF_CNY']:,} XAF | {self.base_rates['XOF_CNY']:,} XOF
-• 1 EUR = {self.base_rates['XAF_EUR']:,} XAF | {self.base_rates['XOF_EUR']:,} XOF
+{rate_lines}
 
  **Quick Calculate:**
 Reply: "100 USD", "500 CNY", "200 EUR" or "1000 XOF"
@@ -322,118 +714,38 @@ Reply: "100 USD", "500 CNY", "200 EUR" or "1000 XOF"
         
         return rates_message
     
-    def calculate_reverse_exchange(self, amount, from_currency, to_currency):
-        """Calculate reverse exchange (e.g., XAF to USDT)"""
+    def calculate_reverse_exchange(self, amount, from_currency, to_currency, rates=None):
+        """Calculate reverse exchange (e.g., XAF to USDT)
+        
+        Pass a base_rates snapshot as rates to skip the freshness check.
+        """
         try:
             amount = float(amount)
-            from_currency = from_currency.upper()
-            to_currency = to_currency.upper()
-            
-            # Map common currency aliases to standard codes
-            currency_mappings = {
-                'EURO': 'EUR',
-                'EUROS': 'EUR',
-                'TETHER': 'USDT',
-                'RMB': 'CNY',
-                'YUAN': 'CNY',
-                'DOLLAR': 'USD',
-                'DOLLARS': 'USD',
-                'DIRHAM': 'AED',
-                'DIRHAMS': 'AED'
-            }
+            from_currency = self._CURRENCY_ALIASES.get(from_currency.upper(), from_currency.upper())
+            to_currency = self._CURRENCY_ALIASES.get(to_currency.upper(), to_currency.upper())
             
-            if from_currency in currency_mappings:
-                from_currency = currency_mappings[from_currency]
-            if to_currency in currency_mappings:
-                to_currency = currency_mappings[to_currency]
-            
-            if not self.calculate_rates():
-                return "⚠️ Unable to fetch current rates. Please try again."
-            
-            # XAF to other currencies
-            if from_currency == 'XAF':
-                if to_currency == 'USD':
-                    converted_amount = amount / self.base_rates['XAF_USD']
-                    rate = 1 / self.base_rates['XAF_USD']
-                elif to_currency in ['USDT', 'TETHER']:
-                    converted_amount = amount / self.base_rates['XAF_USDT']
-                    rate = 1 / self.base_rates['XAF_USDT']
-                elif to_currency == 'AED':
-                    converted_amount = amount / self.base_rates['XAF_AED']
-                    rate = 1 / self.base_rates['XAF_AED']
-                elif to_currency in ['CNY', 'RMB', 'YUAN']:
-                    converted_amount = amount / self.base_rates['XAF_CNY']
-                    rate = 1 / self.base_rates['XAF_CNY']
-                elif to_currency == 'EUR':
-                    converted_amount = amount / self.base_rates['XAF_EUR']
-                    rate = 1 / self.base_rates['XAF_EUR']
-                else:
-                    return f"❌ Conversion from {from_currency} to {to_currency} not supported"
-                    
-            # XOF to other currencies
-            elif from_currency == 'XOF':
-                if to_currency == 'USD':
-                    converted_amount = amount / self.base_rates['XOF_USD']
-                    rate = 1 / self.base_rates['XOF_USD']
-                elif to_currency in ['USDT', 'TETHER']:
-                    converted_amount = amount / self.base_rates['XOF_USDT']
-                    rate = 1 / self.base_rates['XOF_USDT']
-                elif to_currency == 'AED':
-                    converted_amount = amount / self.base_rates['XOF_AED']
-                    rate = 1 / self.base_rates['XOF_AED']
-                elif to_currency in ['CNY', 'RMB', 'YUAN']:
-                    converted_amount = amount / self.base_rates['XOF_CNY']
-                    rate = 1 / self.base_rates['XOF_CNY']
-                elif to_currency == 'EUR':
-                    converted_amount = amount / self.base_rates['XOF_EUR']
-                    rate = 1 / self.base_rates['XOF_EUR']
-                else:
-                    return f"❌ Conversion from {from_currency} to {to_currency} not supported"
-            
-            # Foreign currencies to XAF
-            elif to_currency == 'XAF':
-                if from_currency == 'USD':
-                    converted_amount = amount * self.base_rates['XAF_USD']
-                    rate = self.base_rates['XAF_USD']
-                elif from_currency in ['USDT', 'TETHER']:
-                    converted_amount = amount * self.base_rates['XAF_USDT']
-                    rate = self.base_rates['XAF_USDT']
-                elif from_currency == 'AED':
-                    converted_amount = amount * self.base_rates['XAF_AED']
-                    rate = self.base_rates['XAF_AED']
-                elif from_currency in ['CNY', 'RMB', 'YUAN']:
-                    converted_amount = amount * self.base_rates['XAF_CNY']
-                    rate = self.base_rates['XAF_CNY']
-                elif from_currency == 'EUR':
-                    converted_amount = amount * self.base_rates['XAF_EUR']
-                    rate = self.base_rates['XAF_EUR']
-                else:
-                    return f"❌ Conversion from {from_currency} to XAF not supported"
+            # Reject unsupported pairs before any rate fetch
+            local_to_foreign = from_currency in self._LOCAL_CURRENCIES and to_currency in self._CURRENCY_TAGLINES
+            if not local_to_foreign and not (to_currency in self._LOCAL_CURRENCIES and from_currency in self._CURRENCY_TAGLINES):
+                return f"❌ Conversion from {from_currency} to {to_currency} not supported"
             
-            # Foreign currencies to XOF
-            elif to_currency == 'XOF':
-                if from_currency == 'USD':
-                    converted_amount = amount * self.base_rates['XOF_USD']
-                    rate = self.base_rates['XOF_USD']
-                elif from_currency in ['USDT', 'TETHER']:
-                    converted_amount = amount * self.base_rates['XOF_USDT']
-                    rate = self.base_rates['XOF_USDT']
-                elif from_currency == 'AED':
-                    converted_amount = amount * self.base_rates['XOF_AED']
-                    rate = self.base_rates['XOF_AED']
-                elif from_currency in ['CNY', 'RMB', 'YUAN']:
-                    converted_amount = amount * self.base_rates['XOF_CNY']
-                    rate = self.base_rates['XOF_CNY']
-                elif from_currency == 'EUR':
-                    converted_amount = amount * self.base_rates['XOF_EUR']
-                    rate = self.base_rates['XOF_EUR']
-                else:
-                    return f"❌ Conversion from {from_currency} to XOF not supported"
+            if rates is None:
+                if not self._rates_fresh() and not self.calculate_rates():
+                    return "⚠️ Unable to fetch current rates. Please try again."
+                rates = self.base_rates
+            
+            # Local (XAF/XOF) to foreign divides by the selling rate, the
+            # other direction multiplies by it
+            if local_to_foreign:
+                selling_rate = rates[f'{from_currency}_{to_currency}']
+                rate = 1 / selling_rate
+                converted_amount = amount / selling_rate
             else:
-                return f"❌ Conversion from {from_currency} to {to_currency} not supported"
+                rate = rates[f'{to_currency}_{from_currency}']
+                converted_amount = amount * rate
             
             # Format the response
-            greeting = self.get_greeting_and_disclaimer()
+            greeting = self._GREETING
             return f"""
 {greeting}💱 **EVA FX REVERSE CALCULATION**
 
@@ -443,7 +755,7 @@ Exchange Rate: 1 {from_currency} = {rate:.6f} {to_currency}
 Current {from_currency}/{to_currency} rate with service fee included
 
 🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
+📅 Updated: {rates['last_updated']}
 ⚠️ *Premium exchange rates by EVA Fx*
             """.strip()
             
@@ -453,280 +765,121 @@ Current {from_currency}/{to_currency} rate with service fee included
             logger.error(f"Error in reverse exchange calculation: {e}")
             return "❌ Error calculating exchange. Please try again."
     
-    def calculate_exchange(self, amount, currency):
-        """Calculate exchange amount for a specific currency"""
+    def calculate_exchange(self, amount, currency, rates=None):
+        """Calculate exchange amount for a specific currency
+        
+        Pass a base_rates snapshot as rates to skip the freshness check.
+        """
         try:
             amount = float(amount)
-            currency = currency.upper()
-            
-            # Map common currency aliases to standard codes
-            currency_mappings = {
-                'EURO': 'EUR',
-                'EUROS': 'EUR',
-                'TETHER': 'USDT',
-                'RMB': 'CNY',
-                'YUAN': 'CNY',
-                'DOLLAR': 'USD',
-                'DOLLARS': 'USD',
-                'DIRHAM': 'AED',
-                'DIRHAMS': 'AED'
-            }
-            
-            if currency in currency_mappings:
-                currency = currency_mappings[currency]
-            
-            if not self.calculate_rates():
+            currency = self._CURRENCY_ALIASES.get(currency.upper(), currency.upper())
+            
+            # Reject unsupported currencies before any rate fetch
+            if currency not in self._SUPPORTED_CURRENCIES:
+                return f"❌ Currency '{currency}' not supported. Available: {self._SUPPORTED_LIST}\n\n🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/"
+            if rates is not None:
+                return self._format_exchange_message(amount, currency, rates)
+            if not self._rates_fresh() and not self.calculate_rates():
                 return "⚠️ Unable to fetch current rates. Please try again."
-            
-            if currency == 'USD':
-                xaf_amount = amount * self.base_rates['XAF_USD']
-                xof_amount = amount * self.base_rates['XOF_USD']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
-{greeting}💱 **EVA FX CALCULATION**
-
-**{amount:,} USD → {xaf_amount:,} XAF**
-**{amount:,} USD → {xof_amount:,} XOF**
-
-Rates: 1 USD = {self.base_rates['XAF_USD']:,} XAF | {self.base_rates['XOF_USD']:,} XOF
-*Service fee included*
-
-🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
-⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
-                
-            elif currency in ['USDT', 'TETHER']:
-                xaf_amount = amount * self.base_rates['XAF_USDT']
-                xof_amount = amount * self.base_rates['XOF_USDT']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
-{greeting}💱 **EVA FX CALCULATION**
-
-**{amount:,} USDT → {xaf_amount:,} XAF**
-**{amount:,} USDT → {xof_amount:,} XOF**
-
-Rates: 1 USDT = {self.base_rates['XAF_USDT']:,} XAF | {self.base_rates['XOF_USDT']:,} XOF
-*Service fee included*
-
-🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
-⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
-                
-            elif currency == 'AED':
-                xaf_amount = amount * self.base_rates['XAF_AED']
-                xof_amount = amount * self.base_rates['XOF_AED']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
-{greeting}💱 **EVA FX CALCULATION**
-
-**{amount:,} AED → {xaf_amount:,} XAF**
-**{amount:,} AED → {xof_amount:,} XOF**
-
-Rates: 1 AED = {self.base_rates['XAF_AED']:,} XAF | {self.base_rates['XOF_AED']:,} XOF
-*Service fee included*
-
-🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
-⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
+            # Repeated messages ("100 USD") reuse the reply rendered from the
+            # same snapshot until the rates change
+            rates = self.base_rates
+            snapshot, replies = self._exchange_replies
+            if snapshot is not rates:
+                replies = {}
+                self._exchange_replies = (rates, replies)
+            reply = replies.get((amount, currency))
+            if reply is None:
+                reply = self._format_exchange_message(amount, currency, rates)
+                if len(replies) < self._exchange_replies_max:
+                    replies[(amount, currency)] = reply
+            return reply
                 
-            elif currency in ['CNY', 'RMB', 'YUAN']:
-                xaf_amount = amount * self.base_rates['XAF_CNY']
-                xof_amount = amount * self.base_rates['XOF_CNY']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
-{greeting}💱 **EVA FX CALCULATION**
-
-**{amount:,} CNY → {xaf_amount:,} XAF**
-**{amount:,} CNY → {xof_amount:,} XOF**
-
-Rates: 1 CNY = {self.base_rates['XAF_CNY']:,} XAF | {self.base_rates['XOF_CNY']:,} XOF
-*Premium China market rates*
-
-🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
-⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
-                
-            elif currency == 'EUR':
-                xaf_amount = amount * self.base_rates['XAF_EUR']
-                xof_amount = amount * self.base_rates['XOF_EUR']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
-{greeting}💱 **EVA FX CALCULATION**
-
-**{amount:,} EUR → {xaf_amount:,} XAF**
-**{amount:,} EUR → {xof_amount:,} XOF**
-
-Rates: 1 EUR = {self.base_rates['XAF_EUR']:,} XAF | {self.base_rates['XOF_EUR']:,} XOF
-*Premium European market rates*
-
-🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
-⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
-            elif currency == 'XAF':
-                usd_amount = amount / self.base_rates['XAF_USD']
-                usdt_amount = amount / self.base_rates['XAF_USDT']
-                aed_amount = amount / self.base_rates['XAF_AED']
-                cny_amount = amount / self.base_rates['XAF_CNY']
-                eur_amount = amount / self.base_rates['XAF_EUR']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
+        except ValueError:
+            return "❌ Invalid amount. Please enter a number (e.g., '100 USD')\n\n🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/"
+        except Exception as e:
+            logger.error(f"Error calculating exchange: {e}")
+            return "⚠️ Error processing exchange calculation. Please try again.\n\n🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/"
+    
+    def _format_exchange_message(self, amount, currency, rates):
+        """Build the calculate_exchange reply for an already-normalized, supported currency"""
+        greeting = self._GREETING
+        if currency in self._CURRENCY_TAGLINES:
+            xaf_rate = rates[f'XAF_{currency}']
+            xof_rate = rates[f'XOF_{currency}']
+            return f"""
 {greeting}💱 **EVA FX CALCULATION**
 
-**{amount:,} XAF → {usd_amount:.2f} USD**
-**{amount:,} XAF → {usdt_amount:.2f} USDT**
-**{amount:,} XAF → {aed_amount:.2f} AED**
-**{amount:,} XAF → {cny_amount:.2f} CNY**
-**{amount:,} XAF → {eur_amount:.2f} EUR**
+**{amount:,} {currency} → {amount * xaf_rate:,} XAF**
+**{amount:,} {currency} → {amount * xof_rate:,} XOF**
 
-Selling rates (XAF to foreign currency)
-*Service fee included in rates*
+Rates: 1 {currency} = {xaf_rate:,} XAF | {xof_rate:,} XOF
+{self._CURRENCY_TAGLINES[currency]}
 
 🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
+📅 Updated: {rates['last_updated']}
 ⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
-            elif currency == 'XOF':
-                usd_amount = amount / self.base_rates['XOF_USD']
-                usdt_amount = amount / self.base_rates['XOF_USDT']
-                aed_amount = amount / self.base_rates['XOF_AED']
-                cny_amount = amount / self.base_rates['XOF_CNY']
-                eur_amount = amount / self.base_rates['XOF_EUR']
-                greeting = self.get_greeting_and_disclaimer()
-                return f"""
+            """.strip()
+        else:
+            conversions = '\n'.join(
+                f"**{amount:,} {currency} → {amount / rates[f'{currency}_{code}']:.2f} {code}**"
+                for code in self._CURRENCY_TAGLINES
+            )
+            return f"""
 {greeting}💱 **EVA FX CALCULATION**
 
-**{amount:,} XOF → {usd_amount:.2f} USD**
-**{amount:,} XOF → {usdt_amount:.2f} USDT**
-**{amount:,} XOF → {aed_amount:.2f} AED**
-**{amount:,} XOF → {cny_amount:.2f} CNY**
-**{amount:,} XOF → {eur_amount:.2f} EUR**
+{conversions}
 
-Selling rates (XOF to foreign currency)
+Selling rates ({currency} to foreign currency)
 *Service fee included in rates*
 
 🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/
-📅 Updated: {self.base_rates['last_updated']}
+📅 Updated: {rates['last_updated']}
 ⚠️ *Premium exchange rates by EVA Fx*
-                """.strip()
-            else:
-                return f"❌ Currency '{currency}' not supported. Available: USD, USDT, AED, CNY, EUR, XAF, XOF\n\n🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/"
-                
-        except ValueError:
-            return "❌ Invalid amount. Please enter a number (e.g., '100 USD')\n\n🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/"
-        except Exception as e:
-            logger.error(f"Error calculating exchange: {e}")
-            return "⚠️ Error processing exchange calculation. Please try again.\n\n🌐 **Contact EVA Fx:** https://whatsapp-bot-96xm.onrender.com/"
+            """.strip()
     
-    def get_trading_process_info(self, amount, currency, target_currency="XAF"):
-        """Get trading process information with deposit requirements"""
+    def get_trading_process_info(self, amount, currency, target_currency="XAF", rates=None):
+        """Get trading process information with deposit requirements
+        
+        Pass a base_rates snapshot as rates to skip the freshness check.
+        """
         try:
             amount = float(amount)
-            currency = currency.upper()
-            target_currency = target_currency.upper()
+            currency = self._CURRENCY_ALIASES.get(currency.upper(), currency.upper())
+            target_currency = self._CURRENCY_ALIASES.get(target_currency.upper(), target_currency.upper())
+            
+            # Reject unsupported pairs before any rate fetch
+            if currency in self._CURRENCY_TAGLINES:
+                supported = target_currency in self._LOCAL_CURRENCIES
+            elif currency in self._LOCAL_CURRENCIES:
+                supported = target_currency in self._SUPPORTED_CURRENCIES and target_currency != currency
+            else:
+                return "❌ Source currency not supported"
+            if not supported:
+                return "❌ Target currency not supported"
             
-            if not self.calculate_rates():
-                return "⚠️ Unable to fetch current rates. Please try again."
+            if rates is None:
+                if not self._rates_fresh() and not self.calculate_rates():
+                    return "⚠️ Unable to fetch current rates. Please try again."
+                rates = self.base_rates
             
             # Calculate conversion
-            if currency == 'USD':
-                if target_currency == 'XAF':
-                    converted_amount = amount * self.base_rates['XAF_USD']
-                    rate = self.base_rates['XAF_USD']
-                elif target_currency == 'XOF':
-                    converted_amount = amount * self.base_rates['XOF_USD']
-                    rate = self.base_rates['XOF_USD']
-                else:
-                    return "❌ Target currency not supported"
-            elif currency in ['USDT', 'TETHER']:
-                if target_currency == 'XAF':
-                    converted_amount = amount * self.base_rates['XAF_USDT']
-                    rate = self.base_rates['XAF_USDT']
-                elif target_currency == 'XOF':
-                    converted_amount = amount * self.base_rates['XOF_USDT']
-                    rate = self.base_rates['XOF_USDT']
-                else:
-                    return "❌ Target currency not supported"
-            elif currency == 'AED':
-                if target_currency == 'XAF':
-                    converted_amount = amount * self.base_rates['XAF_AED']
-                    rate = self.base_rates['XAF_AED']
-                elif target_currency == 'XOF':
-                    converted_amount = amount * self.base_rates['XOF_AED']
-                    rate = self.base_rates['XOF_AED']
-                else:
-                    return "❌ Target currency not supported"
-            elif currency in ['CNY', 'RMB', 'YUAN']:
-                if target_currency == 'XAF':
-                    converted_amount = amount * self.base_rates['XAF_CNY']
-                    rate = self.base_rates['XAF_CNY']
-                elif target_currency == 'XOF':
-                    converted_amount = amount * self.base_rates['XOF_CNY']
-                    rate = self.base_rates['XOF_CNY']
-                else:
-                    return "❌ Target currency not supported"
-            elif currency == 'EUR':
-                if target_currency == 'XAF':
-                    converted_amount = amount * self.base_rates['XAF_EUR']
-                    rate = self.base_rates['XAF_EUR']
-                elif target_currency == 'XOF':
-                    converted_amount = amount * self.base_rates['XOF_EUR']
-                    rate = self.base_rates['XOF_EUR']
-                else:
-                    return "❌ Target currency not supported"
-            elif currency == 'XAF':
-                if target_currency == 'USD':
-                    converted_amount = amount / self.base_rates['XAF_USD']
-                    rate = 1 / self.base_rates['XAF_USD']
-                elif target_currency in ['USDT', 'TETHER']:
-                    converted_amount = amount / self.base_rates['XAF_USDT']
-                    rate = 1 / self.base_rates['XAF_USDT']
-                elif target_currency == 'AED':
-                    converted_amount = amount / self.base_rates['XAF_AED']
-                    rate = 1 / self.base_rates['XAF_AED']
-                elif target_currency in ['CNY', 'RMB', 'YUAN']:
-                    converted_amount = amount / self.base_rates['XAF_CNY']
-                    rate = 1 / self.base_rates['XAF_CNY']
-                elif target_currency == 'EUR':
-                    converted_amount = amount / self.base_rates['XAF_EUR']
-                    rate = 1 / self.base_rates['XAF_EUR']
-                elif target_currency == 'XOF':
-                    # XAF to XOF conversion (both are similar but with different rates)
-                    xaf_to_usd = amount / self.base_rates['XAF_USD']
-                    converted_amount = xaf_to_usd * self.base_rates['XOF_USD']
-                    rate = self.base_rates['XOF_USD'] / self.base_rates['XAF_USD']
-                else:
-                    return "❌ Target currency not supported"
-            elif currency == 'XOF':
-                if target_currency == 'USD':
-                    converted_amount = amount / self.base_rates['XOF_USD']
-                    rate = 1 / self.base_rates['XOF_USD']
-                elif target_currency in ['USDT', 'TETHER']:
-                    converted_amount = amount / self.base_rates['XOF_USDT']
-                    rate = 1 / self.base_rates['XOF_USDT']
-                elif target_currency == 'AED':
-                    converted_amount = amount / self.base_rates['XOF_AED']
-                    rate = 1 / self.base_rates['XOF_AED']
-                elif target_currency in ['CNY', 'RMB', 'YUAN']:
-                    converted_amount = amount / self.base_rates['XOF_CNY']
-                    rate = 1 / self.base_rates['XOF_CNY']
-                elif target_currency == 'EUR':
-                    converted_amount = amount / self.base_rates['XOF_EUR']
-                    rate = 1 / self.base_rates['XOF_EUR']
-                elif target_currency == 'XAF':
-                    # XOF to XAF conversion
-                    xof_to_usd = amount / self.base_rates['XOF_USD']
-                    converted_amount = xof_to_usd * self.base_rates['XAF_USD']
-                    rate = self.base_rates['XAF_USD'] / self.base_rates['XOF_USD']
-                else:
-                    return "❌ Target currency not supported"
+            if currency in self._CURRENCY_TAGLINES:
+                rate = rates[f'{target_currency}_{currency}']
+                converted_amount = amount * rate
+            elif target_currency in self._CURRENCY_TAGLINES:
+                selling_rate = rates[f'{currency}_{target_currency}']
+                converted_amount = amount / selling_rate
+                rate = 1 / selling_rate
             else:
-                return "❌ Source currency not supported"
-            
+                # XAF <-> XOF crosses through their USD selling rates
+                source_usd = rates[f'{currency}_USD']
+                target_usd = rates[f'{target_currency}_USD']
+                converted_amount = amount / source_usd * target_usd
+                rate = target_usd / source_usd
+            
+            # Inline f-strings are compiled once with the module; a str.format
+            # template would be re-parsed on every call
             return f"""
 🏦 **EVA FX TRADING PROCESS**
 
@@ -784,6 +937,21 @@ Rate: 1 {currency} = {rate:,} {target_currency}
         except Exception as e:
             logger.error(f"Error in trading process info: {e}")
             return "⚠️ Error generating trading information. Please try again."
+    
+    # Awaitable variants for async callers (the Telegram bot); a cold-cache
+    # refresh runs in a worker thread instead of blocking the event loop
+    async def get_daily_rates_async(self):
+        return await asyncio.to_thread(self.get_daily_rates)
+    
+    async def calculate_exchange_async(self, amount, currency):
+        return await asyncio.to_thread(self.calculate_exchange, amount, currency)
+    
+    async def calculate_reverse_exchange_async(self, amount, from_currency, to_currency):
+        return await asyncio.to_thread(self.calculate_reverse_exchange, amount, from_currency, to_currency)
+    
+    async def get_trading_process_info_async(self, amount, currency, target_currency="XAF"):
+        return await asyncio.to_thread(self.get_trading_process_info, amount, currency, target_currency)
 
-# Global FX trader instance
-fx_trader = FXTrader()
+# Global FX trader instance; the app and the Telegram bot call
+# fx_trader.start() at startup, so importing this module stays offline
+fx_trader = FXTrader(background_refresh=False)
@@ -2,14 +2,15 @@ import os
 import logging
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
 from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
-from fx_trader import FXTrader
+from fx_trader import fx_trader
 from financial_news import FinancialNewsAnalyzer
 from openai import OpenAI
 import asyncio
 import json
 import re
 from datetime import datetime, time
-import pytz
+from typing import Optional
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,10 +24,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class TelegramBot:
-    def __init__(self, token: str):
+    def __init__(self, token: str, financial_analyzer: Optional[FinancialNewsAnalyzer] = None):
         self.token = token
-        self.fx_trader = FXTrader()
-        self.financial_analyzer = FinancialNewsAnalyzer()  # Add financial news analyzer
+        # Shared module-level instance: one refresh thread, session and rate cache per process
+        self.fx_trader = fx_trader
+        # Reuse the web app's analyzer when running inside it, so both paths share one warm cache
+        self.financial_analyzer = financial_analyzer or FinancialNewsAnalyzer()
         self.application = None
         
         # Initialize OpenAI client
@@ -72,7 +75,7 @@ class TelegramBot:
         # Daily scheduler settings
         self.scheduled_groups = set()  # Store group IDs for daily rates
         self.daily_rates_time = time(10, 0)  # 10:00 AM
-        self.timezone = pytz.timezone('Africa/Lagos')  # WAT timezone
+        self.timezone = ZoneInfo('Africa/Lagos')  # WAT timezone
         
         # AI personality for more human responses with financial expertise
         self.ai_personality = """You are Eva, a friendly and professional FX trading assistant with access to real-time financial news and market data. You help people with currency exchange, rates, trading information, and market analysis. You are knowledgeable about:
@@ -88,6 +91,9 @@ You speak in a warm, conversational tone while providing accurate, data-driven i
         
     async def setup_bot(self):
         """Initialize the bot application"""
+        # Keep FX rates and market data warm so handlers don't wait on the providers
+        self.fx_trader.start()
+        self.financial_analyzer.start()
         self.application = Application.builder().token(self.token).build()
         
         # Add handlers
@@ -298,7 +304,7 @@ Just type naturally! I understand:
             user = update.effective_user
             chat_type = update.message.chat.type if update.message and update.message.chat else 'private'
             
-            rates_info = self.fx_trader.get_daily_rates()
+            rates_info = await self.fx_trader.get_daily_rates_async()
             
             # Personal greeting based on chat type
             if chat_type == 'private':
@@ -329,17 +335,18 @@ Just type naturally! I understand:
                 group_name = update.message.chat.title or "group"
                 greeting = f"📊 Current rates for {group_name}:"
                 
-                # Create compact group-friendly message
+                # Create compact group-friendly message from one rates snapshot
+                rates_data = self.fx_trader.base_rates
                 compact_rates = f"""
 {greeting}
 
-💱 **EVA Fx Rates** - {self.fx_trader.base_rates.get('last_updated', 'Now')}
+💱 **EVA Fx Rates** - {rates_data.get('last_updated', 'Now')}
 
-🇺🇸 **USD**: {self.fx_trader.base_rates.get('XAF_USD', 'N/A')} XAF | {self.fx_trader.base_rates.get('XOF_USD', 'N/A')} XOF
-💰 **USDT**: {self.fx_trader.base_rates.get('XAF_USDT', 'N/A')} XAF | {self.fx_trader.base_rates.get('XOF_USDT', 'N/A')} XOF  
-🇦🇪 **AED**: {self.fx_trader.base_rates.get('XAF_AED', 'N/A')} XAF | {self.fx_trader.base_rates.get('XOF_AED', 'N/A')} XOF
-🇨🇳 **CNY**: {self.fx_trader.base_rates.get('XAF_CNY', 'N/A')} XAF | {self.fx_trader.base_rates.get('XOF_CNY', 'N/A')} XOF
-🇪🇺 **EUR**: {self.fx_trader.base_rates.get('XAF_EUR', 'N/A')} XAF | {self.fx_trader.base_rates.get('XOF_EUR', 'N/A')} XOF
+🇺🇸 **USD**: {rates_data.get('XAF_USD', 'N/A')} XAF | {rates_data.get('XOF_USD', 'N/A')} XOF
+💰 **USDT**: {rates_data.get('XAF_USDT', 'N/A')} XAF | {rates_data.get('XOF_USDT', 'N/A')} XOF  
+🇦🇪 **AED**: {rates_data.get('XAF_AED', 'N/A')} XAF | {rates_data.get('XOF_AED', 'N/A')} XOF
+🇨🇳 **CNY**: {rates_data.get('XAF_CNY', 'N/A')} XAF | {rates_data.get('XOF_CNY', 'N/A')} XOF
+🇪🇺 **EUR**: {rates_data.get('XAF_EUR', 'N/A')} XAF | {rates_data.get('XOF_EUR', 'N/A')} XOF
 
 💡 _Use /convert for calculations_ • _Mention @{context.bot.username} for help_
                 """.strip()
@@ -407,7 +414,7 @@ Just type naturally! I understand:
             to_currency = context.args[3].upper()
             
             # Use the existing get_trading_process_info method for conversions
-            result = self.fx_trader.get_trading_process_info(amount, from_currency, to_currency)
+            result = await self.fx_trader.get_trading_process_info_async(amount, from_currency, to_currency)
             
             # Add personal touch to response
             if chat_type == 'private':
@@ -434,8 +441,9 @@ Just type naturally! I understand:
             # Show loading message
             loading_msg = await update.message.reply_text("📰 Getting latest financial news... ⏳")
             
-            # Get fresh financial news
-            news_items = self.financial_analyzer.get_latest_financial_news(limit=6)
+            # Get fresh financial news (off the event loop)
+            news_result = await self.financial_analyzer.get_latest_financial_news_async(limit=6)
+            news_items = news_result.get('news', []) if isinstance(news_result, dict) else news_result
             
             if not news_items:
                 await loading_msg.edit_text("❌ Unable to fetch financial news at this time. Please try again later.")
@@ -507,9 +515,11 @@ Just type naturally! I understand:
             # Show loading message
             loading_msg = await update.message.reply_text("📊 Analyzing current market conditions... ⏳")
             
-            # Get market analysis
-            currency_analysis = self.financial_analyzer.get_currency_analysis()
-            commodities_analysis = self.financial_analyzer.get_commodities_analysis()
+            # Get market analysis (both fetches run concurrently, off the event loop)
+            currency_analysis, commodities_analysis = await asyncio.gather(
+                self.financial_analyzer.get_currency_analysis_async(),
+                self.financial_analyzer.get_commodities_analysis_async()
+            )
             
             if not currency_analysis and not commodities_analysis:
                 await loading_msg.edit_text("❌ Unable to fetch market data at this time. Please try again later.")
@@ -596,9 +606,12 @@ Just type naturally! I understand:
             loading_msg = await update.message.reply_text("🥇 Analyzing gold market... ⏳")
             
             # Get gold-specific data
-            gold_data = self.financial_analyzer.get_market_data(['Gold', 'Silver'])
-            currency_analysis = self.financial_analyzer.get_currency_analysis()
-            news_items = self.financial_analyzer.get_latest_financial_news(limit=10)
+            gold_data, currency_analysis, news_result = await asyncio.gather(
+                self.financial_analyzer.get_market_data_async(['Gold', 'Silver']),
+                self.financial_analyzer.get_currency_analysis_async(),
+                self.financial_analyzer.get_latest_financial_news_async(limit=10)
+            )
+            news_items = news_result.get('news', []) if isinstance(news_result, dict) else news_result
             news_impact = self.financial_analyzer.analyze_news_impact(news_items)
             
             # Format gold analysis
@@ -685,7 +698,7 @@ Just type naturally! I understand:
             user_query = " ".join(context.args) if context.args else ""
             
             # Generate comprehensive insights
-            insights = self.financial_analyzer.get_trading_insights(user_query)
+            insights = await self.financial_analyzer.get_trading_insights_async(user_query)
             
             if not insights or len(insights) < 50:
                 await loading_msg.edit_text("❌ Unable to generate trading insights at this time. Please try again later.")
@@ -758,14 +771,11 @@ Just type naturally! I understand:
     async def group_rates_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /grouprates command - show rates in group-friendly format"""
         try:
-            # Get current rates
+            # Get current rates; only stale or missing ones need a refresh
+            if not self.fx_trader.rates_ready:
+                await self.fx_trader.calculate_rates_async()
             rates_data = self.fx_trader.base_rates
             
-            if not rates_data or not rates_data.get('last_updated'):
-                # Fallback to getting fresh rates
-                self.fx_trader.get_daily_rates()
-                rates_data = self.fx_trader.base_rates
-            
             # Create compact group-friendly message
             compact_rates = f"""
 💱 **EVA Fx Rates** - {rates_data.get('last_updated', 'Now')}
@@ -902,12 +912,10 @@ _Use /convert to calculate amounts_
             return
             
         try:
-            # Get fresh rates
+            # Get fresh rates; only stale or missing ones need a refresh
+            if not self.fx_trader.rates_ready:
+                await self.fx_trader.calculate_rates_async()
             rates_data = self.fx_trader.base_rates
-            if not rates_data or not rates_data.get('last_updated'):
-                # Force update rates
-                self.fx_trader.get_daily_rates()
-                rates_data = self.fx_trader.base_rates
             
             # Create daily broadcast message
             now = datetime.now(self.timezone)
@@ -953,7 +961,7 @@ _Use /convert to calculate amounts_
         callback_data = query.data
         
         if callback_data == "rates":
-            rates_info = self.fx_trader.get_daily_rates()
+            rates_info = await self.fx_trader.get_daily_rates_async()
             await query.edit_message_text(text=rates_info)
             
         elif callback_data == "convert":
@@ -974,7 +982,7 @@ _Use /convert to calculate amounts_
             
             # For EVA Fx, convert to XAF by default
             to_currency = 'XAF'
-            result = self.fx_trader.get_trading_process_info(amount, from_currency, to_currency)
+            result = await self.fx_trader.get_trading_process_info_async(amount, from_currency, to_currency)
             await query.edit_message_text(text=result)
         
         logger.info(f"Button callback handled: {callback_data} for user {query.from_user.id}")
@@ -1035,13 +1043,13 @@ _Use /convert to calculate amounts_
                     await self.group_rates_command(update, context)
                     return
                 else:
-                    response = self.fx_trader.get_daily_rates()
+                    response = await self.fx_trader.get_daily_rates_async()
                 
             elif 'convert' in message_text.lower() or ' to ' in message_text.lower():
-                response = self._parse_conversion_message(message_text)
+                response = await asyncio.to_thread(self._parse_conversion_message, message_text)
                 
             elif any(currency in message_text.upper() for currency in ['USD', 'EUR', 'GBP', 'AED', 'USDT', 'XAF', 'XOF', 'CNY']):
-                response = self._handle_currency_mention(message_text)
+                response = await asyncio.to_thread(self._handle_currency_mention, message_text)
                 
             else:
                 # Use AI for general conversation